@@ -0,0 +1,37 @@
+"""
+_backend.py – libsecp256k1 bindings for crypto_identity
+========================================================
+Thin adapter over `coincurve` (libsecp256k1).  Importing this module
+raises ImportError when coincurve is not installed; crypto_identity
+then falls back to its pure-Python Double-and-Add implementation.
+
+Wire formats (shared with the pure-Python path)
+-----------------------------------------------
+  sk        : 32 raw big-endian bytes
+  pk        : 33-byte compressed SEC1 point (0x02/0x03 || x)
+  signature : 64 bytes r || s, low-s normalised
+"""
+
+import coincurve
+from coincurve.ecdsa import (cdata_to_der, der_to_cdata,
+                             deserialize_compact, serialize_compact)
+
+
+def pubkey_from_secret(sk_bytes):
+    """Derives the compressed 33-byte Public Key for a 32-byte Secret Key."""
+    return coincurve.PrivateKey(sk_bytes).public_key.format(compressed=True)
+
+
+def sign(msg, sk_bytes):
+    """Signs SHA-256(msg) and returns the 64-byte compact (r, s) signature."""
+    der = coincurve.PrivateKey(sk_bytes).sign(msg)
+    return serialize_compact(der_to_cdata(der))
+
+
+def verify(msg, sig, pk_bytes):
+    """Verifies a 64-byte compact signature over SHA-256(msg)."""
+    try:
+        der = cdata_to_der(deserialize_compact(sig))
+        return coincurve.PublicKey(pk_bytes).verify(der, msg)
+    except (ValueError, TypeError):
+        return False
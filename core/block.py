@@ -1,6 +1,19 @@
+import base64
 import hashlib
 import time
 from core.merkle import merkle_root
+from core.transaction import Transaction
+
+
+# Stand-in for the genesis prev_hash ("0") and an empty Merkle root
+_ZERO32 = b"\x00" * 32
+
+
+def _digest_bytes(hex_digest):
+    """Raw 32 bytes of a hex digest; genesis/empty markers map to zeros."""
+    if not hex_digest or hex_digest == "0":
+        return _ZERO32
+    return bytes.fromhex(hex_digest)
 
 
 class Block:
@@ -8,70 +21,83 @@ class Block:
     Represents a Block in the petroleum supply chain ledger.
     Implements the core block structure required for PoW mining and validation.
     """
-    def __init__(self, prev_hash, transactions):
+    __slots__ = ("prev_hash", "transactions", "timestamp", "nonce",
+                 "merkle", "hash")
+
+    def __init__(self, prev_hash, transactions, merkle=None):
         self.prev_hash = prev_hash
         self.transactions = transactions
-        self.timestamp = time.time()
-        
+        self.timestamp = time.time_ns()   # int nanoseconds since the epoch
+        self.nonce = 0
 
-        txids = [tx.txid for tx in transactions] if transactions else []
-        self.merkle = merkle_root(txids) if txids else None
+        # A known root (e.g. from storage) skips rebuilding the tree
+        if merkle is None and transactions:
+            merkle = merkle_root([tx.txid_bytes for tx in transactions]).hex()
+        self.merkle = merkle
 
         self.hash = self.compute_hash()
 
+    def header_midstate(self):
+        """
+        SHA-256 state after absorbing the fixed header fields
+        (prev_hash, merkle root, timestamp). Nonce retries can .copy()
+        this state and only hash the 8-byte nonce suffix.
+        """
+        h = hashlib.sha256(_digest_bytes(self.prev_hash))
+        h.update(_digest_bytes(self.merkle))
+        h.update(self.timestamp.to_bytes(8, "big"))
+        return h
+
     def compute_hash(self):
         """
         Uses SHA-256 to create a digital fingerprint of the block.
         Ensures tamper-resistance; changing any data results in a completely different hash.
         """
-        block_string = f"{self.prev_hash}{self.merkle}{self.timestamp}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        h = self.header_midstate()
+        h.update(self.nonce.to_bytes(8, "big"))
+        return h.hexdigest()
 
     def to_dict(self):
         """
         Prepares block data for Gossip Protocol propagation and 
-        database storage.
+        database storage. Key and signature bytes are base64-encoded.
         """
         return {
             "prev_hash": self.prev_hash,
             "timestamp": self.timestamp,
             "merkle": self.merkle,
+            "nonce": self.nonce,
             "hash": self.hash,
-            "transactions": [
-                {
-                    "sender_pk": tx.sender_pk,
-                    "receiver_addr": tx.receiver_addr,
-                    "data": tx.data,
-                    "signature": tx.signature,
-                    "txid": tx.txid
-                }
-                for tx in self.transactions
-            ]
+            "transactions": [tx.to_dict() for tx in self.transactions]
         }
 
     @staticmethod
-    def from_dict(data):
+    def from_dict(data, trusted=False):
         """
         Reconstructs a block from received network messages 
         during the syncing or Gossip process.
+        trusted=True is for the node's own database: transactions are
+        restored as stored instead of re-deriving addresses and TxIDs.
         """
-        from core.transaction import Transaction
-
         txs = []
         for t in data["transactions"]:
+            if trusted:
+                txs.append(Transaction.from_trusted_dict(t))
+                continue
+
             tx = Transaction(
                 None,
-                tuple(t["sender_pk"]),
+                base64.b64decode(t["sender_pk"]),
                 t["receiver_addr"],
                 t["data"]
             )
-            tx.signature = tuple(t["signature"])
+            tx.signature = base64.b64decode(t["signature"])
             tx.txid = t["txid"]
             txs.append(tx)
 
-        block = Block(data["prev_hash"], txs)
+        block = Block(data["prev_hash"], txs, merkle=data["merkle"])
         block.timestamp = data["timestamp"]
+        block.nonce = data.get("nonce", 0)
         block.hash = data["hash"]
-        block.merkle = data["merkle"]
 
-        return block
\ No newline at end of file
+        return block
@@ -1,5 +1,125 @@
 import json
+import mmap
+import os
+
 from core.block import Block
+from core.tx_batch import TxBatch
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+# Append-only JSON-lines log: one block per line, in chain order.
+# Default for standalone use; each Node passes its own per-port path.
+DB_PATH = "blockchain_db.jsonl"
+
+
+class _LazyChain:
+    """
+    List-like view over the memory-mapped DB log.
+    load() checks each stored line's prev_hash link and records its byte
+    span; the Block (and its Transactions) is only built the first time
+    it is indexed, so a restart never pays to rebuild blocks that are not
+    inspected. Blocks appended after load are kept in an in-memory tail.
+    """
+
+    def __init__(self, mm, spans):
+        self._mm = mm
+        self._spans = spans                  # (start, end) of each stored line
+        self._decoded = [None] * len(spans)
+        self._tail = []
+
+    def __len__(self):
+        return len(self._spans) + len(self._tail)
+
+    def _stored(self, i):
+        block = self._decoded[i]
+        if block is None:
+            start, end = self._spans[i]
+            block = Block.from_dict(_loads(self._mm[start:end]), trusted=True)
+            self._decoded[i] = block
+        return block
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("chain index out of range")
+
+        stored = len(self._spans)
+        return self._stored(i) if i < stored else self._tail[i - stored]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, block):
+        self._tail.append(block)
+
+    def close(self):
+        self._mm.close()
+
+
+def _line_spans(mm):
+    """Returns the (start, end) byte span of every non-blank line in mm."""
+    spans = []
+    start, size = 0, len(mm)
+    while start < size:
+        end = mm.find(b"\n", start)
+        if end == -1:
+            end = size
+        if mm[start:end].strip():
+            spans.append((start, end))
+        start = end + 1
+    return spans
+
+
+# Block.to_dict writes the header fields first and "transactions" last
+_TX_KEY = b'"transactions"'
+
+
+def _read_header(line):
+    """
+    Parses only the header fields of one stored block line, i.e. the text
+    before its "transactions" key, so the link scan never decodes a
+    transaction.  Returns None for a line that is not a whole block record
+    (no transactions key, or cut short before the closing "]}").
+    """
+    cut = line.find(_TX_KEY)
+    if cut == -1 or not line.rstrip().endswith(b"]}"):
+        return None
+    return _loads(line[:cut].rstrip().rstrip(b",") + b"}")
+
+
+def _linked_prefix(mm, spans):
+    """
+    Number of leading lines that are whole records and whose prev_hash is
+    the hash on the line before, i.e. how much of the log is one intact
+    chain.  Only headers are parsed (see _read_header).
+    """
+    prev = None
+    for i, (start, end) in enumerate(spans):
+        try:
+            header = _read_header(mm[start:end])
+            if header is None:
+                return i
+            if prev is not None and header["prev_hash"] != prev:
+                return i
+            prev = header["hash"]
+        except (ValueError, KeyError, TypeError):
+            return i
+    return len(spans)
 
 
 class Blockchain:
@@ -7,7 +127,8 @@ class Blockchain:
     Manages the petroleum supply chain ledger.
     Handles block sequencing, persistence, and chain height synchronization.
     """
-    def __init__(self):
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
         self.chain = []
         self.load()
 
@@ -32,36 +153,104 @@ class Blockchain:
         """
         prev_hash = self.chain[-1].hash
         new_block = Block(prev_hash, transactions)
-        self.chain.append(new_block)
-        self.save()
+        self.append(new_block)
         return new_block
 
+    # -------- Append Block --------
+    def append(self, block):
+        """
+        Extends the chain with an already-built block and appends it to the
+        on-disk log, so each new block costs one line write instead of
+        re-serialising the whole chain.
+        """
+        self.chain.append(block)
+        with open(self.db_path, "ab") as f:
+            f.write(_dumps(block.to_dict()) + b"\n")
+
+    # -------- Replace Chain --------
+    def replace_chain(self, blocks):
+        """
+        Adopts a whole new chain (fork switch or sync) and rewrites the log.
+        A memory-mapped view left by load() is closed here, since none of
+        its blocks are read once the new chain is in place.
+        """
+        if isinstance(self.chain, _LazyChain):
+            self.chain.close()
+        self.chain = list(blocks)
+        self.save()
+
     # -------- Save to Disk --------
     def save(self):
         """
         Database Persistence: 
-        Saves the current state of the blockchain to a JSON-based database.
+        Rewrites the log as a snapshot of the current chain. Only needed when
+        the chain is replaced wholesale (genesis, fork switch, sync); the file
+        is swapped in atomically so a crash never leaves a half-written log.
         """
-        data = [block.to_dict() for block in self.chain]
+        if isinstance(self.chain, _LazyChain):
+            # decode everything before the mapping goes away
+            lazy, self.chain = self.chain, list(self.chain)
+            lazy.close()
 
-        with open("blockchain_db.json", "w") as f:
-            json.dump(data, f)
+        tmp_path = self.db_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(_dumps(block.to_dict()) + b"\n"
+                             for block in self.chain))
+        os.replace(tmp_path, self.db_path)
 
     # -------- Load from Disk --------
-    def load(self):
+    def load(self, verify=False):
         """
         Retrieves the ledger from the database to resume 
         participation in the P2P network after a restart.
+        The local DB is trusted, so signatures are not re-checked unless
+        verify=True, in which case a chain that fails is discarded.
+        The log is memory-mapped and every line's prev_hash link is checked,
+        but Block objects are built on first access (see _LazyChain).  The
+        log is cut at the first unreadable or unlinked line (a torn append,
+        or foreign blocks written into the file), keeping the intact chain
+        before it; peers supply the rest on sync.
         """
-        try:
-            with open("blockchain_db.json", "r") as f:
-                data = json.load(f)
+        if not os.path.exists(self.db_path):
+            self.chain = []
+            return
 
-            self.chain = [Block.from_dict(b) for b in data]
+        with open(self.db_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:   # an empty file cannot be mapped
+                self.chain = []
+                return
 
-        except:
+        spans = _line_spans(mm)
+        intact = _linked_prefix(mm, spans)
+        if intact:
+            self.chain = _LazyChain(mm, spans[:intact])
+        else:
+            mm.close()
             self.chain = []
 
+        if intact < len(spans):
+            print(f"[BLOCKCHAIN] Dropped {len(spans) - intact} block(s) from the "
+                  f"first unreadable or unlinked line of the log onwards")
+            self.save()
+
+        if verify and not self.full_verify():
+            print("[BLOCKCHAIN] Stored chain failed signature check, discarding")
+            self.chain = []
+
+    # -------- Full Verify --------
+    def full_verify(self, pool=None, shards=1):
+        """
+        Re-checks every transaction signature in the chain.
+        With a ThreadPoolExecutor and shards > 1, large chains are split
+        across the pool (see TxBatch.verify_all); already-verified rows
+        are served from the verify cache.
+        """
+        batch = TxBatch([tx for block in self.chain
+                         for tx in block.transactions])
+        return batch.verify_all(pool, shards)
+
     # -------- Height --------
     def height(self):
         """
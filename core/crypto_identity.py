@@ -1,5 +1,13 @@
+import functools
 import hashlib
 import secrets
+import threading
+from collections import OrderedDict
+
+try:
+    from core import _backend
+except ImportError:
+    _backend = None
 
 # secp256k1 parameters
 p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
@@ -14,6 +22,11 @@ n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
 INF = (None, None)
 
+# Bounded LRU of signatures already proven valid (see verify_cached)
+_VERIFY_CACHE_MAX = 4096
+_verify_cache = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
 
 # ---------------- Basic Math ----------------
 
@@ -69,41 +82,124 @@ def scalar_mult(k, P):
     return result
 
 
+# Fixed-base table: _G_TABLE[w][i] = i * 16^w * G, built on first use
+_G_TABLE = None
+
+
+def _g_table():
+    """
+    Precomputes the 4-bit window table for the generator G (64 windows x 16).
+    Built once, lazily, so the libsecp256k1 backend never pays for it.
+    """
+    global _G_TABLE
+    if _G_TABLE is None:
+        table = []
+        base = G
+        for _ in range(64):
+            row = [INF, base]
+            for _ in range(14):
+                row.append(point_add(row[-1], base))
+            table.append(row)
+            base = point_add(row[-1], base)
+        _G_TABLE = table
+    return _G_TABLE
+
+
+def scalar_mult_G(k):
+    """
+    Computes k*G from the precomputed window table: one point addition per
+    non-zero 4-bit nibble of k and no doublings, instead of the ~256
+    doublings plus additions of the generic Double-and-Add.
+    """
+    table = _g_table()
+    result = INF
+    w = 0
+    while k > 0:
+        nibble = k & 15
+        if nibble:
+            result = point_add(result, table[w][nibble])
+        k >>= 4
+        w += 1
+    return result
+
+
+def encode_point(P):
+    """
+    Serialises a curve point to the compressed 33-byte SEC1 form
+    (0x02 for even y, 0x03 for odd y, followed by the 32-byte x coordinate).
+    """
+    x, y = P
+    return (b"\x03" if y & 1 else b"\x02") + x.to_bytes(32, "big")
+
+
+def decode_point(pk):
+    """
+    Recovers the (x, y) curve point from its compressed 33-byte SEC1 form.
+    Since p % 4 == 3, the square root of y^2 is (y^2)^((p+1)/4) mod p.
+    """
+    if len(pk) != 33 or pk[0] not in (2, 3):
+        raise ValueError("invalid compressed public key")
+    x = int.from_bytes(pk[1:], "big")
+    y2 = (pow(x, 3, p) + b) % p
+    y = pow(y2, (p + 1) // 4, p)
+    if y * y % p != y2:
+        raise ValueError("point not on curve")
+    if (y & 1) != (pk[0] & 1):
+        y = p - y
+    return (x, y)
+
+
 # ---------------- Key Generation ----------------
 
 def generate_keypair():
     """
     Generates a 256-bit Secret Key (sk) using a random number 
     and SHA-256 hash. Derives the Public Key (pk) via scalar multiplication.
+    sk is returned as 32 raw bytes and pk as the compressed 33-byte point.
     """
     sk = int(hashlib.sha256(secrets.token_bytes(32)).hexdigest(), 16) % n
-    pk = scalar_mult(sk, G)
-    return sk, pk
+    sk_bytes = sk.to_bytes(32, "big")
+
+    if _backend is not None:
+        return sk_bytes, _backend.pubkey_from_secret(sk_bytes)
 
+    return sk_bytes, encode_point(scalar_mult_G(sk))
 
+
+@functools.lru_cache(maxsize=1024)
 def address_from_pk(pk):
     """
     Derives the Wallet Address.
-    Takes the SHA-256 hash of the Public Key and uses the last 16 bits 
-    represented in a 4-digit hexadecimal format (e.g., 0x9e1c).
+    Takes the SHA-256 hash of the compressed Public Key and uses the last
+    16 bits represented in a 4-digit hexadecimal format (e.g., 0x9e1c).
     """
-    pk_bytes = str(pk[0]).encode() + str(pk[1]).encode()
-    h = hashlib.sha256(pk_bytes).hexdigest()
-    return "0x" + h[-4:]
+    h = hashlib.sha256(pk).digest()
+    return "0x" + h[-2:].hex()
 
 
 # ---------------- ECDSA ----------------
 
+def _msg_bytes(msg):
+    """Messages may be passed as str or as already-encoded bytes."""
+    return msg if isinstance(msg, bytes) else msg.encode()
+
+
 def sign(msg, sk):
     """
     Signs a transaction using the sender's sk.
     Produces a signature pair (r, s) to ensure non-repudiation and data integrity.
+    The pair is returned as 64 bytes (r || s) with s normalised to the low half
+    of the group order, matching libsecp256k1.
     """
-    z = int(hashlib.sha256(msg.encode()).hexdigest(), 16)
+    if _backend is not None:
+        return _backend.sign(_msg_bytes(msg), sk)
+
+    sk = int.from_bytes(sk, "big")
+    z = int.from_bytes(hashlib.sha256(_msg_bytes(msg)).digest(), "big")
 
     while True:
         k = secrets.randbelow(n)
-        x, _ = scalar_mult(k, G)
+        x, _ = scalar_mult_G(k)
         r = x % n
         if r == 0:
             continue
@@ -111,8 +207,10 @@ def sign(msg, sk):
         s = (mod_inv(k, n) * (z + r * sk)) % n
         if s == 0:
             continue
+        if s > n // 2:
+            s = n - s
 
-        return (r, s)
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
 
 
 def verify(msg, signature, pk):
@@ -121,35 +219,69 @@ def verify(msg, signature, pk):
     Uses the sender's Public Key (pk) to verify the (r, s) signature pair.
     A valid result proves the sender authorized the transaction and it is untampered.
     """
-    r, s = signature
-    if not (1 <= r < n and 1 <= s < n):
+    if _backend is not None:
+        return _backend.verify(_msg_bytes(msg), signature, pk)
+
+    if len(signature) != 64:
+        return False
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:], "big")
+    if not (1 <= r < n and 1 <= s <= n // 2):
         return False
 
-    z = int(hashlib.sha256(msg.encode()).hexdigest(), 16)
+    try:
+        pk = decode_point(pk)
+    except ValueError:
+        return False
+
+    z = int.from_bytes(hashlib.sha256(_msg_bytes(msg)).digest(), "big")
 
     w = mod_inv(s, n)
     u1 = (z * w) % n
     u2 = (r * w) % n
 
-    P = point_add(scalar_mult(u1, G), scalar_mult(u2, pk))
+    P = point_add(scalar_mult_G(u1), scalar_mult(u2, pk))
     if P == INF:
         return False
 
     return (P[0] % n) == r
 
 
+def verify_cached(msg, signature, pk):
+    """
+    verify() behind a bounded LRU of successful checks, so a transaction
+    seen first via gossip and again inside a block is only checked once.
+    The key is the full (msg, signature, pk) triple rather than a TxID,
+    which peers supply themselves; only valid results are cached.
+    """
+    key = (_msg_bytes(msg), signature, pk)
+    with _verify_cache_lock:
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return True
+
+    if not verify(msg, signature, pk):
+        return False
+
+    with _verify_cache_lock:
+        _verify_cache[key] = True
+        if len(_verify_cache) > _VERIFY_CACHE_MAX:
+            _verify_cache.popitem(last=False)
+    return True
+
+
 # ---------------- Demo ----------------
 
 if __name__ == "__main__":
     sk, pk = generate_keypair()
     addr = address_from_pk(pk)
 
-    print("Private Key:", hex(sk))
-    print("Public Key :", pk)
+    print("Private Key:", sk.hex())
+    print("Public Key :", pk.hex())
     print("Address    :", addr)
 
     msg = "100 barrels delivered"
     sig = sign(msg, sk)
 
-    print("\nSignature:", sig)
+    print("\nSignature:", sig.hex())
     print("Verify   :", verify(msg, sig, pk))
\ No newline at end of file
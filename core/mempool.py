@@ -12,16 +12,20 @@ Each node holds ONE Mempool instance.  Transactions arrive either:
 Public interface
 ----------------
   mempool.add(tx)         -> bool  (True if accepted / False if duplicate)
-  mempool.take(n)         -> list[Transaction]  (pop up to n tx for mining)
-  mempool.peek()          -> list[Transaction]  (non-destructive)
+  mempool.take(n)         -> tuple[Transaction] (pop up to n tx for mining)
+  mempool.peek()          -> tuple[Transaction] (non-destructive snapshot)
   mempool.remove(txids)   -> None  (purge confirmed txids after block mined)
+  mempool.contains(txid)  -> bool  (O(1) membership test by hex txid)
   mempool.size()          -> int
+  mempool.reset()         -> None  (drop every tx; node identity is kept)
 """
 
 import threading
 import time
 import hashlib
 import random
+import string
+from collections import OrderedDict
 
 from core.crypto_identity import generate_keypair, address_from_pk
 from core.transaction import Transaction
@@ -71,36 +75,74 @@ _HUBS        = ["Cushing Hub", "Fujairah Hub", "ARA Hub"]
 _STATIONS    = ["PetroGas Sta-7", "QuickFuel Sta-12", "EnergyMart Sta-3"]
 
 
-def _random_tx_data():
-    """Return a realistic petroleum supply-chain event string."""
-    template = random.choice(_SUPPLY_CHAIN_TEMPLATES)
-    return template.format(
-        block_id  = random.randint(1, 99),
-        well_id   = random.randint(100, 999),
-        ship_id   = random.randint(1000, 9999),
-        check_id  = random.randint(100, 999),
-        tank_id   = random.randint(1, 20),
-        inv_id    = random.randint(10000, 99999),
-        lc_id     = random.randint(1000, 9999),
-        qc_id     = random.randint(100, 999),
-        barrels   = random.randint(100, 50000),
-        pct       = random.randint(20, 95),
-        price     = round(random.uniform(60, 110), 2),
-        amount    = random.randint(10000, 5000000),
-        quarter   = random.randint(1, 4),
-        carbon_tons = random.randint(50, 5000),
-        field     = random.choice(_FIELDS),
-        refinery  = random.choice(_REFINERIES),
-        port      = random.choice(_PORTS),
-        tanker    = f"MT-{random.randint(100,999)}",
-        product   = random.choice(_PRODUCTS),
-        grade     = random.choice(_GRADES),
-        hub       = random.choice(_HUBS),
-        station   = random.choice(_STATIONS),
-        seller    = random.choice(["UpstreamCo", "OilMajor", "Aramco LLC"]),
-        buyer     = random.choice(["RefineGroup", "FuelTrader", "GovOilDesk"]),
-        dest      = random.choice(["China", "India", "EU", "Japan"]),
-    )
+# One generator per template field; only the fields a template uses are drawn.
+# Each takes the random.Random instance to draw from.
+_FIELD_GENERATORS = {
+    "block_id":    lambda r: r.randint(1, 99),
+    "well_id":     lambda r: r.randint(100, 999),
+    "ship_id":     lambda r: r.randint(1000, 9999),
+    "check_id":    lambda r: r.randint(100, 999),
+    "tank_id":     lambda r: r.randint(1, 20),
+    "inv_id":      lambda r: r.randint(10000, 99999),
+    "lc_id":       lambda r: r.randint(1000, 9999),
+    "qc_id":       lambda r: r.randint(100, 999),
+    "barrels":     lambda r: r.randint(100, 50000),
+    "pct":         lambda r: r.randint(20, 95),
+    "price":       lambda r: round(r.uniform(60, 110), 2),
+    "amount":      lambda r: r.randint(10000, 5000000),
+    "quarter":     lambda r: r.randint(1, 4),
+    "carbon_tons": lambda r: r.randint(50, 5000),
+    "field":       lambda r: r.choice(_FIELDS),
+    "refinery":    lambda r: r.choice(_REFINERIES),
+    "port":        lambda r: r.choice(_PORTS),
+    "tanker":      lambda r: f"MT-{r.randint(100,999)}",
+    "product":     lambda r: r.choice(_PRODUCTS),
+    "grade":       lambda r: r.choice(_GRADES),
+    "hub":         lambda r: r.choice(_HUBS),
+    "station":     lambda r: r.choice(_STATIONS),
+    "seller":      lambda r: r.choice(["UpstreamCo", "OilMajor", "Aramco LLC"]),
+    "buyer":       lambda r: r.choice(["RefineGroup", "FuelTrader", "GovOilDesk"]),
+    "dest":        lambda r: r.choice(["China", "India", "EU", "Japan"]),
+}
+
+
+def _compile_template(template):
+    """
+    Splits a format template into its literal chunks and binds each field
+    to its generator once, so generating a transaction never re-parses the
+    format string or looks fields up by name.  (Every template uses each
+    field at most once, so one draw per placeholder is correct.)
+    Returns (head, ((generator, literal), ...)).
+    """
+    literals, generators = [], []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        literals.append(literal)
+        if field is not None:
+            generators.append(_FIELD_GENERATORS[field])
+    if len(literals) == len(generators):
+        literals.append("")
+    return literals[0], tuple(zip(generators, literals[1:]))
+
+
+_COMPILED_TEMPLATES = [_compile_template(t) for t in _SUPPLY_CHAIN_TEMPLATES]
+
+
+def _random_tx_data(rng):
+    """Return a realistic petroleum supply-chain event string drawn from *rng*."""
+    head, pieces = rng.choice(_COMPILED_TEMPLATES)
+    parts = [head]
+    for generate, literal in pieces:
+        parts.append(str(generate(rng)))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def _txid_key(txid):
+    """Raw bytes of a hex txid, or None if it is not a hex string."""
+    try:
+        return bytes.fromhex(txid)
+    except (ValueError, TypeError):
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -110,11 +152,20 @@ def _random_tx_data():
 class Mempool:
     """Thread-safe transaction pool for a single node."""
 
-    def __init__(self, node_port: int, max_size: int = 500):
+    __slots__ = ("_lock", "_pool", "_snapshot", "max_size",
+                 "node_port", "on_add", "_rng", "_sk", "_pk", "_addr")
+
+    def __init__(self, node_port: int, max_size: int = 500, on_add=None,
+                 seed=None):
         self._lock   = threading.Lock()
-        self._pool   = {}          # txid -> Transaction (dict preserves insertion order)
+        self._pool   = OrderedDict()   # txid_bytes -> Transaction, oldest first
+        self._snapshot = None          # cached tuple for peek(); None = stale
         self.max_size   = max_size
         self.node_port  = node_port
+        self.on_add     = on_add       # called (no args) after each accepted tx
+        # Private generator for tx contents: fixed *seed* = reproducible
+        # data, and no shared state with other mempools / the random module
+        self._rng       = random.Random(seed)
 
         # Each node gets its own identity for generating local transactions
         self._sk, self._pk = generate_keypair()
@@ -129,42 +180,82 @@ class Mempool:
         Accept a transaction into the pool.
         Returns True if added, False if duplicate or pool full.
         """
+        # Keyed by the raw 32-byte digest: no hex string is built per call
+        # and bytes keys cache their hash on the tx after the first lookup
+        key = tx.txid_bytes
         with self._lock:
-            if tx.txid in self._pool:
+            if key in self._pool:
                 return False  # already seen
             if len(self._pool) >= self.max_size:
                 return False  # pool full – could implement fee-priority eviction
-            self._pool[tx.txid] = tx
-            return True
+            self._pool[key] = tx
+            self._snapshot = None
+        if self.on_add is not None:
+            self.on_add()
+        return True
 
     def take(self, n: int = 10):
         """
         Remove and return up to *n* transactions for inclusion in a block.
-        Called by the miner just before sealing a block.
+        Called by the miner just before sealing a block.  Returned as a
+        tuple, like peek(), so the block's tx list cannot be mutated later.
         """
         with self._lock:
-            txids = list(self._pool.keys())[:n]
-            selected = [self._pool.pop(tid) for tid in txids]
-            return selected
+            n = min(n, len(self._pool))
+            if n:
+                self._snapshot = None
+            return tuple([self._pool.popitem(last=False)[1] for _ in range(n)])
 
     def peek(self):
-        """Return a snapshot of the current pool (non-destructive)."""
-        with self._lock:
-            return list(self._pool.values())
+        """
+        Return a snapshot of the current pool (non-destructive).
+        The tuple is cached until the next write, so repeated reads
+        between writes skip the lock entirely.
+        """
+        snap = self._snapshot
+        if snap is None:
+            with self._lock:
+                snap = self._snapshot
+                if snap is None:
+                    snap = self._snapshot = tuple(self._pool.values())
+        return snap
 
     def remove(self, txids):
-        """Purge confirmed transactions after a block is committed."""
+        """
+        Purge confirmed transactions (hex txids) after a block is committed.
+        Malformed txids are skipped; no pooled transaction can have one.
+        """
+        keys = [_txid_key(tid) for tid in txids]
         with self._lock:
-            for tid in txids:
-                self._pool.pop(tid, None)
+            for key in keys:
+                if key is not None:
+                    self._pool.pop(key, None)
+            self._snapshot = None
 
-    def size(self) -> int:
+    def contains(self, txid: str) -> bool:
+        """
+        True if the (hex) txid is currently pooled; no snapshot is built.
+        A malformed txid is never pooled, so it gives False.
+        """
+        key = _txid_key(txid)
+        if key is None:
+            return False
         with self._lock:
-            return len(self._pool)
+            return key in self._pool
+
+    def size(self) -> int:
+        # len() of a dict is a single atomic read under the GIL
+        return len(self._pool)
 
     def is_empty(self) -> bool:
         return self.size() == 0
 
+    def reset(self):
+        """Empties the pool in place, keeping this node's keypair and settings."""
+        with self._lock:
+            self._pool.clear()
+            self._snapshot = None
+
     # ------------------------------------------------------------------
     # Transaction factory – petroleum supply chain
     # ------------------------------------------------------------------
@@ -179,7 +270,7 @@ class Mempool:
             _, rpk = generate_keypair()
             receiver_addr = address_from_pk(rpk)
 
-        data = _random_tx_data()
+        data = _random_tx_data(self._rng)
         tx = Transaction(self._sk, self._pk, receiver_addr, data)
         self.add(tx)
         return tx
@@ -191,11 +282,19 @@ class Mempool:
         Optionally direct some transactions at known peer addresses.
         """
         partners = partner_addresses or []
-        txs = []
+        receivers = []
         for i in range(count):
-            addr = partners[i % len(partners)] if partners else None
-            tx = self.generate_local_tx(receiver_addr=addr)
-            txs.append(tx)
+            if partners:
+                receivers.append(partners[i % len(partners)])
+            else:
+                # Generate a throw-away receiver address
+                _, rpk = generate_keypair()
+                receivers.append(address_from_pk(rpk))
+        datas = [_random_tx_data(self._rng) for _ in range(count)]
+
+        txs = Transaction.build_many(self._sk, self._pk, receivers, datas)
+        for tx in txs:
+            self.add(tx)
             print(f"[MEMPOOL {self.node_port}] Seeded TX {tx.txid[:12]}… | {tx.data[:60]}")
         return txs
 
@@ -211,7 +310,7 @@ class Mempool:
             while True:
                 time.sleep(interval)
                 tx = self.generate_local_tx(
-                    receiver_addr=(random.choice(partner_addresses)
+                    receiver_addr=(self._rng.choice(partner_addresses)
                                    if partner_addresses else None)
                 )
                 print(f"[MEMPOOL {self.node_port}] New TX {tx.txid[:12]}… "
@@ -3,16 +3,35 @@ import hashlib
 
 def hash_pair(a, b):
     """
-    Concatenates two hex strings and returns their SHA-256 hash.
+    Concatenates two 32-byte digests and returns their raw SHA-256 digest.
     This supports the integrity requirements where TxIDs and block hashes 
     must ensure the 'Avalanche Effect'.
     """
-    return hashlib.sha256((a + b).encode()).hexdigest()
+    return hashlib.sha256(a + b).digest()
+
+
+def _pad_even(level):
+    """
+    Duplicates the last node of an odd-length level without branching:
+    level[-1:] is repeated (len & 1) times, i.e. zero or one time.
+    """
+    return level + level[-1:] * (len(level) & 1)
+
+
+def _hash_level(level):
+    """
+    Hashes one tree level into its parent level.
+    The level is packed into one contiguous buffer (last node duplicated
+    if odd) so each parent is a single SHA-256 call over a 64-byte slice.
+    """
+    buf = b"".join(_pad_even(level))
+    sha256 = hashlib.sha256
+    return [sha256(buf[i:i + 64]).digest() for i in range(0, len(buf), 64)]
 
 
 def merkle_root(txids):
     """
-    Computes the Merkle Root for a list of transaction IDs (TxIDs).
+    Computes the Merkle Root for a list of raw 32-byte transaction IDs (TxIDs).
     
     As per Task 2, this root summarizes all transactions in a block.
     The function iteratively hashes pairs of SHA-256 strings until a single 
@@ -27,22 +46,7 @@ def merkle_root(txids):
 
     # loop until single hash
     while len(level) > 1:
-
-        next_level = []
-
-        for i in range(0, len(level), 2):
-
-            left = level[i]
-
-            # duplicate last if odd
-            if i + 1 < len(level):
-                right = level[i+1]
-            else:
-                right = left
-
-            next_level.append(hash_pair(left, right))
-
-        level = next_level
+        level = _hash_level(level)
 
     return level[0]
 
@@ -50,11 +54,11 @@ def merkle_root(txids):
 # test run
 if __name__ == "__main__":
     txs = ["a", "b", "c", "d"]
-    hashed = [hashlib.sha256(x.encode()).hexdigest() for x in txs]
+    hashed = [hashlib.sha256(x.encode()).digest() for x in txs]
 
     root = merkle_root(hashed)
 
-    print("Merkle Root:", root)
+    print("Merkle Root:", root.hex())
 
 
 def merkle_proof(txids, index):
@@ -69,22 +73,12 @@ def merkle_proof(txids, index):
     level = txids[:]
 
     while len(level) > 1:
-
-        if index % 2 == 0:
-            pair_index = index + 1 if index + 1 < len(level) else index
-        else:
-            pair_index = index - 1
-
-        proof.append(level[pair_index])
+        # once the level is even-length the sibling is always index ^ 1
+        level = _pad_even(level)
+        proof.append(level[index ^ 1])
 
         # build next level
-        next_level = []
-        for i in range(0, len(level), 2):
-            left = level[i]
-            right = level[i+1] if i+1 < len(level) else left
-            next_level.append(hash_pair(left, right))
-
-        level = next_level
-        index //= 2
+        level = _hash_level(level)
+        index >>= 1
 
     return proof
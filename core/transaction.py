@@ -1,5 +1,12 @@
+import base64
 import hashlib
-from core.crypto_identity import sign, verify, address_from_pk
+import sys
+from core.crypto_identity import sign, verify_cached, address_from_pk
+
+
+def _message(sender_addr, receiver_addr, data):
+    """The signed and hashed payload, 'sender:receiver:data', as bytes."""
+    return f"{sender_addr}:{receiver_addr}:{data}".encode()
 
 
 class Transaction:
@@ -7,36 +14,118 @@ class Transaction:
     Represents a supply chain event or financial transfer within the network.
     This class handles identity derivation, signing, and integrity hashing.
     """
+    # Many small instances (mempools, blocks, chain sync): no per-object __dict__
+    __slots__ = ("sender_pk", "sender_addr", "receiver_addr", "data",
+                 "msg_bytes", "signature", "txid_bytes")
+
     def __init__(self, sender_sk, sender_pk, receiver_addr, data):
         """
         Initializes the transaction object with cryptographic identities and data.
         
-        :param sender_sk: The sender's 256-bit Secret Key (sk).
-        :param sender_pk: The sender's Public Key (pk) derived via Double-and-Add.
+        :param sender_sk: The sender's 256-bit Secret Key (sk), 32 raw bytes.
+        :param sender_pk: The sender's compressed 33-byte Public Key (pk).
         :param receiver_addr: The 16-bit hexadecimal identifier of the receiver.
         :param data: Details of the event (e.g., '100 barrels delivered').
         """
-        self.sender_pk = sender_pk
-        self.sender_addr = address_from_pk(sender_pk)
-        self.receiver_addr = receiver_addr
-        self.data = data
-
-        self.msg = f"{self.sender_addr}:{self.receiver_addr}:{self.data}"
+        self._init_fields(sender_pk, address_from_pk(sender_pk),
+                          receiver_addr, data)
 
         # Only sign if sender has private key
         if sender_sk is not None:
-            self.signature = sign(self.msg, sender_sk)
+            self.signature = sign(self.msg_bytes, sender_sk)
         else:
             self.signature = None
 
-        self.txid = hashlib.sha256(self.msg.encode()).hexdigest()
+        self.txid_bytes = hashlib.sha256(self.msg_bytes).digest()
+
+    @classmethod
+    def from_trusted_dict(cls, d):
+        """
+        Rebuilds a transaction from this node's own database without
+        re-deriving the sender address or re-hashing the TxID.
+        Only for data the node wrote itself; network payloads must go
+        through __init__ so the address is derived from the pk.
+        """
+        tx = cls.__new__(cls)
+        sender_pk = base64.b64decode(d["sender_pk"])
+        tx._init_fields(sender_pk,
+                        d.get("sender_addr") or address_from_pk(sender_pk),
+                        d["receiver_addr"], d["data"])
+        tx.signature = base64.b64decode(d["signature"])
+        tx.txid = d["txid"]
+        return tx
+
+    @classmethod
+    def build_many(cls, sender_sk, sender_pk, receivers, datas):
+        """
+        Builds one signed transaction per (receiver_addr, data) pair from a
+        single sender, e.g. to seed a mempool. The sender address is derived
+        once for the whole batch instead of once per transaction.
+        """
+        sender_addr = address_from_pk(sender_pk)
+        sha256 = hashlib.sha256
+
+        txs = []
+        for receiver_addr, data in zip(receivers, datas):
+            tx = cls.__new__(cls)
+            tx._init_fields(sender_pk, sender_addr, receiver_addr, data)
+            tx.signature = (sign(tx.msg_bytes, sender_sk)
+                            if sender_sk is not None else None)
+            tx.txid_bytes = sha256(tx.msg_bytes).digest()
+            txs.append(tx)
+        return txs
+
+    def _init_fields(self, sender_pk, sender_addr, receiver_addr, data):
+        """
+        Sets the identity, payload and message fields shared by every
+        constructor. The caller derives sender_addr (or trusts a stored
+        one); signature and TxID are left to the caller.
+        """
+        self.sender_pk = sender_pk
+        # Few distinct addresses, many transactions: share one str per address
+        self.sender_addr = sys.intern(sender_addr)
+        self.receiver_addr = sys.intern(receiver_addr)
+        self.data = data
+
+        # Signing, verifying and the TxID all hash these bytes
+        self.msg_bytes = _message(self.sender_addr, self.receiver_addr, data)
+
+    def to_dict(self):
+        """
+        Serialises the transaction for gossip and database storage.
+        Key and signature bytes are base64-encoded.
+        """
+        return {
+            "sender_pk": base64.b64encode(self.sender_pk).decode(),
+            "sender_addr": self.sender_addr,
+            "receiver_addr": self.receiver_addr,
+            "data": self.data,
+            "signature": base64.b64encode(self.signature).decode(),
+            "txid": self.txid,
+        }
+
+    @property
+    def msg(self):
+        """Text form of the signed message; decoded only when asked for."""
+        return self.msg_bytes.decode()
+
+    @property
+    def txid(self):
+        """Hex form of the TxID, used for JSON payloads and mempool keys."""
+        return self.txid_bytes.hex()
+
+    @txid.setter
+    def txid(self, value):
+        self.txid_bytes = bytes.fromhex(value)
+
     def verify(self):
         """
         Verifies the transaction signature using the sender's public key (pk).
         A valid signature proves the sender authorized the transaction and the 
         data is untampered.
+        Valid results are cached, so re-checking a transaction is a lookup.
         """
-        return verify(self.msg, self.signature, self.sender_pk)
+        return verify_cached(self.msg_bytes, self.signature, self.sender_pk)
 
     def show(self):
         """
@@ -48,5 +137,5 @@ class Transaction:
         print("To   :", self.receiver_addr)
         print("Data :", self.data)
         print("TxID :", self.txid)
-        print("Sig  :", self.signature)
+        print("Sig  :", self.signature.hex() if self.signature else None)
         print("---------------------")
\ No newline at end of file
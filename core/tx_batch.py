@@ -0,0 +1,55 @@
+"""
+tx_batch.py – Struct-of-Arrays view over a block's transactions
+================================================================
+Block validation only needs three fields from each Transaction:
+the signed message, the signature and the sender's public key.
+TxBatch copies them into parallel columns once so signature checks
+run as one tight loop over flat sequences instead of chasing
+attributes through N Transaction objects.
+
+Public interface
+----------------
+  batch = TxBatch(transactions)
+  len(batch)          -> int
+  batch.verify_all()  -> bool  (False on the first invalid signature)
+  batch.verify_all(pool, shards)  -> bool  (rows split across a thread pool)
+"""
+
+from core.crypto_identity import verify_cached
+
+
+# Below this many rows a thread hand-off costs more than it saves
+PARALLEL_MIN_ROWS = 64
+
+
+class TxBatch:
+    """Column-oriented (msgs, sigs, pks) copy of a list of Transactions."""
+
+    def __init__(self, transactions):
+        self.msgs = [tx.msg_bytes for tx in transactions]
+        self.sigs = [tx.signature for tx in transactions]
+        self.pks  = [tx.sender_pk for tx in transactions]
+
+    def __len__(self):
+        return len(self.msgs)
+
+    def verify_all(self, pool=None, shards=1) -> bool:
+        """
+        Verifies every (msg, sig, pk) row; stops at the first failure.
+        Rows already verified via gossip are served from the verify cache.
+
+        With a ThreadPoolExecutor and shards > 1, large batches are split
+        into `shards` contiguous slices verified concurrently (the
+        libsecp256k1 backend releases the GIL while verifying).
+        """
+        n = len(self)
+        if pool is None or shards < 2 or n < PARALLEL_MIN_ROWS:
+            return self._verify_rows(0, n)
+        step = -(-n // shards)
+        futures = [pool.submit(self._verify_rows, i, i + step)
+                   for i in range(0, n, step)]
+        return all(f.result() for f in futures)
+
+    def _verify_rows(self, start, stop) -> bool:
+        return all(map(verify_cached, self.msgs[start:stop],
+                       self.sigs[start:stop], self.pks[start:stop]))
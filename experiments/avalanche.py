@@ -3,20 +3,20 @@ import hashlib
 
 def sha256_bits(data):
     """
-    Computes the SHA-256 hash of a string and returns its 256-bit binary representation.
+    Computes the SHA-256 hash of a string and returns its raw 32-byte (256-bit) digest.
     This is used to analyze the 'Avalanche Effect' at the bit level.
     """
-    h = hashlib.sha256(data.encode()).hexdigest()
-    return bin(int(h, 16))[2:].zfill(256)
+    return hashlib.sha256(data.encode()).digest()
 
 
 def bit_difference(a, b):
     """
-    Compares two bitstrings and returns the total number of differing bits.
+    Compares two digests and returns the total number of differing bits.
     This quantification helps determine how significantly a small change in 
     input affects the final hash output.
+    XOR leaves a 1 exactly where the bits differ; bit_count() is a popcount.
     """
-    diff = sum(x != y for x, y in zip(a, b))
+    diff = (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).bit_count()
     return diff
 
 
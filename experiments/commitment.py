@@ -1,4 +1,5 @@
 import hashlib
+import hmac
 import secrets
 
 
@@ -11,10 +12,10 @@ def commit(m):
     without knowing the actual value 'm'.
     
     :param m: The message (delivery volume) to commit to.
-    :return: (c, r) where 'c' is the hash commitment and 'r' is the secret nonce.
+    :return: (c, r) where 'c' is the raw 32-byte hash commitment and 'r' is the secret nonce.
     """
     r = secrets.token_hex(8)
-    c = hashlib.sha256((m + r).encode()).hexdigest()
+    c = hashlib.sha256((m + r).encode()).digest()
     return c, r
 
 
@@ -29,9 +30,10 @@ def verify(c, m, r):
     :param m: The revealed delivery volume.
     :param r: The revealed nonce.
     :return: True if the revelation matches the commitment, False otherwise.
+    Digests are compared in constant time so the check leaks no timing.
     """
-    check = hashlib.sha256((m + r).encode()).hexdigest()
-    return check == c
+    check = hashlib.sha256((m + r).encode()).digest()
+    return hmac.compare_digest(check, c)
 
 
 # simulate
@@ -39,7 +41,7 @@ message = "100 barrels"
 
 commitment, nonce = commit(message)
 
-print("Commitment:", commitment)
+print("Commitment:", commitment.hex())
 
 # reveal phase
 result = verify(commitment, message, nonce)
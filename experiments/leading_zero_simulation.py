@@ -68,7 +68,6 @@ Both plots are drawn side-by-side in a single figure so the inverse
 relationship between λ and E[Tk] is visually obvious.
 """
 
-import random
 import math
 import matplotlib
 import matplotlib.pyplot as plt
@@ -88,24 +87,26 @@ BASE_LAMBDA  = (HASH_POWER * MEAN_TK) / 100.0   # = 0.02 for hp=30, ia=15
 
 d_values = list(range(0, D_MAX + 1))
 
-# ── Simulation ───────────────────────────────────────────────────────────────
-
-avg_tau       = []   # simulated average waiting time per difficulty level
-lambda_values = []   # exact analytical lambda per difficulty level
+# All waiting-time sampling goes through one NumPy Generator
+# (C ziggurat sampler) rather than per-call random.expovariate
+rng = np.random.default_rng()
 
-for d in d_values:
-    # Effective lambda: each extra leading-zero bit halves the success probability
-    lam_eff = BASE_LAMBDA / (2 ** d)
-    lambda_values.append(lam_eff)
+# ── Simulation ───────────────────────────────────────────────────────────────
 
-    # Draw N_SAMPLES exponential waiting times and average them
-    samples = [random.expovariate(lam_eff) for _ in range(N_SAMPLES)]
-    avg_tau.append(sum(samples) / len(samples))
+# Effective lambda: each extra leading-zero bit halves the success probability
+lambda_values = BASE_LAMBDA / 2.0 ** np.arange(D_MAX + 1)
 
 # Analytical curves (exact, no noise)
-analytical_tau    = [1.0 / lam for lam in lambda_values]
+analytical_tau    = 1.0 / lambda_values
 analytical_lambda = lambda_values   # already exact
 
+# Draw N_SAMPLES exponential waiting times for every d in one call
+# (row d uses scale E[Tk](d)) and average each row; the bars in
+# Graph 1 are this empirical check against the analytical curve
+samples  = rng.exponential(analytical_tau[:, None],
+                           size=(len(d_values), N_SAMPLES))
+avg_tau  = samples.mean(axis=1)   # simulated average waiting time per d
+
 # ── Styling ──────────────────────────────────────────────────────────────────
 
 DARK_BG    = "#0d1117"
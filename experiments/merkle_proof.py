@@ -7,13 +7,14 @@ from core.crypto_identity import generate_keypair
 from core.merkle import merkle_root, merkle_proof
 
 # generate identity
-sk, pk = generate_keypair()
+_, pk = generate_keypair()
 
 # create 8 transactions
-txs = [Transaction(sk, pk, "0xABCD", f"tx{i}") for i in range(8)]
+# (only TxIDs are needed: no secret key, so nothing is signed)
+txs = [Transaction(None, pk, "0xABCD", f"tx{i}") for i in range(8)]
 
 # extract txids
-txids = [tx.txid for tx in txs]
+txids = [tx.txid_bytes for tx in txs]
 
 # build merkle tree
 root = merkle_root(txids)
@@ -21,7 +22,7 @@ root = merkle_root(txids)
 # proof for 4th transaction (index 3)
 proof = merkle_proof(txids, 3)
 
-print("Merkle Root:", root)
+print("Merkle Root:", root.hex())
 print("\nProof Path:")
 for p in proof:
-    print(p)
\ No newline at end of file
+    print(p.hex())
\ No newline at end of file
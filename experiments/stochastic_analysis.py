@@ -281,13 +281,16 @@ ax2.set_title(
 )
 ax2.grid(linestyle="--", alpha=0.4)
 
+table_hps  = np.array([1, 10, 20, 30, 51, 75, 100])
+table_lams = (table_hps * meanTk) / 100.0
+table_etks = 1.0 / table_lams
+
 table = (
     "Formula:  λ = (hp × meanTk) / 100\n"
     "          E[Tk] = 1/λ\n\n"
     + "\n".join(
-        f"hp={hp:>3}%  λ={compute_lambda(hp):.5f}  "
-        f"E[Tk]={1/compute_lambda(hp):>7.1f}s"
-        for hp in [1, 10, 20, 30, 51, 75, 100]
+        f"hp={h:>3}%  λ={l:.5f}  E[Tk]={e:>7.1f}s"
+        for h, l, e in zip(table_hps, table_lams, table_etks)
     )
 )
 ax2.text(0.97, 0.42, table, transform=ax2.transAxes,
@@ -5,15 +5,16 @@ import hashlib
 from core.crypto_identity import generate_keypair
 from core.transaction import Transaction
 
-sk, pk = generate_keypair()
+_, pk = generate_keypair()
 
-txs = [Transaction(sk, pk, "0xDEAD", str(i)) for i in range(8)]
-txids = [tx.txid for tx in txs]
+# Only TxIDs are needed: no secret key, so nothing is signed
+txs = [Transaction(None, pk, "0xDEAD", str(i)) for i in range(8)]
+txids = [tx.txid_bytes for tx in txs]
 
 root = merkle_root(txids)
 proof = merkle_proof(txids, 3)   # proof for 4th tx
 
-print("Merkle Root:", root)
+print("Merkle Root:", root.hex())
 print("\nProof Path:")
 for p in proof:
-    print(p)
+    print(p.hex())
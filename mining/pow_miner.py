@@ -5,7 +5,7 @@ The assignment specifies:
 
   meanTk  = 1.0 / interarrival_time
   lambda  = nodeHashPower * meanTk / 100.0
-  Tk      = random.expovariate(lambda)
+  Tk      ~ Exp(lambda)   (drawn in NumPy batches)
 
 State machine
 -------------
@@ -20,9 +20,15 @@ Thread safety: `abort_event` is a threading.Event; safe to set from
 any thread (e.g. network handler receiving a better block).
 """
 
-import random
 import threading
-import time
+
+import numpy as np
+
+# Waiting times are drawn this many at a time and handed out one by one
+_SAMPLE_BATCH = 1000
+
+# One PCG64 generator for every Miner, seeded once from OS entropy
+_RNG = np.random.default_rng()
 
 
 class Miner:
@@ -41,8 +47,15 @@ class Miner:
         if interarrival <= 0:
             raise ValueError("interarrival must be positive")
 
-        self.hash_power   = hash_power
-        self.interarrival = interarrival
+        # Pre-drawn Exp(lambda) samples, refilled in place when used up or
+        # when lambda changes (one allocation for the miner's lifetime)
+        self._buf     = np.empty(_SAMPLE_BATCH, dtype=np.float64)
+        self._buf_i   = _SAMPLE_BATCH
+
+        # Setting either parameter recomputes the cached lambda (see _set_rate)
+        self._hash_power   = hash_power
+        self._interarrival = interarrival
+        self._set_rate()
 
         # threading.Event used to signal abort from outside
         self.abort_event  = threading.Event()
@@ -56,21 +69,64 @@ class Miner:
     # Lambda / waiting time helpers (public – used by tests & plots)
     # ------------------------------------------------------------------
 
+    def _set_rate(self):
+        """
+        Caches lambda = nodeHashPower * meanTk / 100.0 (meanTk = 1 /
+        interarrival_time) and its inverse, and drops samples drawn
+        for the previous lambda.
+        """
+        self._lam     = (self._hash_power / 100.0) / self._interarrival
+        self._inv_lam = 1.0 / self._lam
+        self._buf_i   = _SAMPLE_BATCH
+
+    @property
+    def hash_power(self) -> float:
+        return self._hash_power
+
+    @hash_power.setter
+    def hash_power(self, value: float):
+        self._hash_power = value
+        self._set_rate()
+
+    @property
+    def interarrival(self) -> float:
+        return self._interarrival
+
+    @interarrival.setter
+    def interarrival(self, value: float):
+        self._interarrival = value
+        self._set_rate()
+
     @property
     def lam(self) -> float:
         """
         Per-node lambda = nodeHashPower * meanTk / 100.0
         where meanTk = 1 / interarrival_time
         """
-        meanTk = 1.0 / self.interarrival
-        return (self.hash_power * meanTk) / 100.0
+        return self._lam
 
     def sample_wait_time(self) -> float:
         """
         Draw one exponential waiting time tau ~ Exp(lambda).
         Expected value = 1/lambda = interarrival / (hash_power/100).
+        Samples come from a NumPy batch of _SAMPLE_BATCH draws.
         """
-        return random.expovariate(self.lam)
+        if self._buf_i >= _SAMPLE_BATCH:
+            self.sample_wait_times(_SAMPLE_BATCH, out=self._buf)
+            self._buf_i = 0
+
+        tau = float(self._buf[self._buf_i])
+        self._buf_i += 1
+        return tau
+
+    def sample_wait_times(self, n: int, out=None) -> np.ndarray:
+        """
+        Draw n independent waiting times as one ndarray (bulk callers).
+        Pass a float64 array of length n as `out` to refill it in place.
+        """
+        samples = _RNG.standard_exponential(n, out=out)
+        samples *= self._inv_lam
+        return samples
 
     # ------------------------------------------------------------------
     # Core mining method
@@ -85,20 +141,17 @@ class Miner:
         self.abort_event.clear()
 
         tau = self.sample_wait_time()
-        self.last_lambda = self.lam
+        self.last_lambda = self._lam
         self.last_tau    = tau
 
-        print(f"  [MINER] lambda={self.lam:.6f}  tau={tau:.2f}s  "
+        print(f"  [MINER] lambda={self._lam:.6f}  tau={tau:.2f}s  "
               f"hash_power={self.hash_power}%")
 
-        deadline = time.time() + tau
-
-        while time.time() < deadline:
-            # Poll abort every 100 ms for responsiveness
-            if self.abort_event.wait(timeout=0.1):
-                self.last_outcome = "aborted"
-                print(f"  [MINER] Mining aborted (received longer chain)")
-                return False
+        # Sleeps until abort() sets the event or tau elapses, whichever is first
+        if self.abort_event.wait(timeout=tau):
+            self.last_outcome = "aborted"
+            print(f"  [MINER] Mining aborted (received longer chain)")
+            return False
 
         self.last_outcome = "mined"
         print(f"  [MINER] Block found after tau={tau:.2f}s")
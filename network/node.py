@@ -18,15 +18,24 @@ Key changes from v02
 4. Liveness: 3 consecutive failures -> report Dead Node to seeds.
 """
 
+import base64
+import os
+import select
+import selectors
 import socket
+import struct
 import threading
 import json
 import time
 import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
+from core.block import Block
 from core.blockchain import Blockchain
 from core.transaction import Transaction
 from core.mempool import Mempool
+from core.tx_batch import TxBatch, PARALLEL_MIN_ROWS
 from mining.pow_miner import Miner
 
 
@@ -36,6 +45,127 @@ TX_PER_BLOCK = 5
 # Max seconds to wait for chain-sync response
 SYNC_TIMEOUT = 10
 
+# Per-node chain log, so nodes sharing a working directory never
+# append to one another's file
+DB_PATH_FMT = "blockchain_db_{port}.jsonl"
+
+# Gossip ids remembered for dedup; the oldest are forgotten beyond this
+SEEN_MESSAGES_MAX = 50_000
+
+# Threads that run message handlers for the server's event loop
+SERVER_WORKERS = 8
+
+# Max seconds a handler may spend writing one reply (e.g. a full chain)
+REPLY_TIMEOUT = 30
+
+# Threads that push gossip to peers concurrently (one slow peer no longer
+# delays the rest)
+GOSSIP_WORKERS = 8
+
+# Threads that verify the signatures of large incoming blocks
+VERIFY_WORKERS = os.cpu_count() or 1
+
+# Node-to-node messages are JSON framed by a 4-byte big-endian length
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def _new_tcp_sock(timeout):
+    """TCP client socket with Nagle off (frames leave at once) + keepalive."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    s.settimeout(timeout)
+    return s
+
+
+def _frame(obj):
+    """Encodes obj as one length-prefixed JSON frame (bytes)."""
+    payload = json.dumps(obj).encode()
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _send_framed(sock, obj):
+    """Sends obj as one length-prefixed JSON frame."""
+    sock.sendall(_frame(obj))
+
+
+def _peer_closed(sock):
+    """
+    True if the far end of an idle outbound socket has closed or reset it.
+    Gossip sockets carry no replies, so readable means EOF or an error;
+    without this check the first frame after a peer restart is accepted by
+    the local kernel and silently lost.
+    """
+    readable, _, _ = select.select((sock,), (), (), 0)
+    if not readable:
+        return False
+    try:
+        return sock.recv(1, socket.MSG_PEEK) == b""
+    except OSError:
+        return True
+
+
+def _recv_exact(sock, n):
+    """Reads exactly n bytes; returns None if the peer closes first."""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:], n - got)
+        if not k:
+            return None
+        got += k
+    return buf
+
+
+def _recv_framed(sock):
+    """Reads one length-prefixed JSON frame; None if the connection closed."""
+    header = _recv_exact(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = _FRAME_HEADER.unpack(header)
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None
+    return json.loads(payload)
+
+
+class _FrameReader:
+    """
+    Buffers bytes from a persistent inbound connection and splits them
+    into frames.  Also counts the messages still being handled so the
+    socket is closed only after the last reply has been written.
+    """
+
+    def __init__(self):
+        self.buf      = bytearray()
+        self.inflight = 0
+        self.eof      = False
+        self.lock     = threading.Lock()
+
+    def feed(self, chunk):
+        """Adds chunk; returns every message whose frame is now whole."""
+        self.buf += chunk
+        hdr = _FRAME_HEADER.size
+        messages = []
+        while len(self.buf) >= hdr:
+            (length,) = _FRAME_HEADER.unpack_from(self.buf)
+            if len(self.buf) < hdr + length:
+                break
+            messages.append(json.loads(self.buf[hdr:hdr + length]))
+            del self.buf[:hdr + length]
+        return messages
+
+    def done(self, conn, eof=False):
+        """Marks one handler finished (or EOF seen); closes conn when idle."""
+        with self.lock:
+            if eof:
+                self.eof = True
+            else:
+                self.inflight -= 1
+            if self.eof and self.inflight == 0:
+                conn.close()
+
 
 class Node:
 
@@ -44,19 +174,29 @@ class Node:
         self.host      = host
         self.port      = port
         self.seed_list = seed_list
-        self.peers     = set()
+        self._peer_conns   = {}   # peer -> persistent outbound gossip socket
+        self._peer_locks   = {}   # peer -> Lock serialising sends on it
+        self.peers     = ()   # frozenset, re-indexed by the setter
 
         self.msg_counter  = 0
-        self.seen_messages = set()
+        self.seen_messages = OrderedDict()   # gossip id -> None, LRU order
+        self._seen_lock    = threading.Lock()
+        self._gossip_pool  = ThreadPoolExecutor(max_workers=GOSSIP_WORKERS)
+        self._verify_pool  = None   # started by _block_verify_pool() if ever needed
+        self._verify_pool_lock = threading.Lock()
         self.liveness      = {}   # peer -> consecutive failure count
 
         # Blockchain & mining state
-        self.blockchain    = Blockchain()
+        self.blockchain    = Blockchain(DB_PATH_FMT.format(port=port))
         self.block_index   = {}   # hash -> Block (all known blocks)
-        self.pending_queue = []   # blocks waiting to be processed (unbounded)
+        self.block_height  = {}   # hash -> length of its chain within block_index
+        self._block_children = {}   # prev_hash -> hashes of indexed children
+        self._index_lock   = threading.Lock()
+        self.pending_queue = deque()   # blocks waiting to be processed (unbounded)
+        self._pending_hashes = set()   # hashes of the blocks in pending_queue
 
         # Mempool with petroleum supply-chain transactions
-        self.mempool = Mempool(node_port=port)
+        self.mempool = Mempool(node_port=port, on_add=self._notify_work)
 
         # Miner
         self.miner   = Miner(hash_power=hash_power, interarrival=interarrival)
@@ -68,6 +208,11 @@ class Node:
         # Lock to serialize pending_queue processing
         self._queue_lock    = threading.Lock()
 
+        # mine_loop parks on this until a block is queued or a tx arrives;
+        # _work_gen counts notifications so none is lost between checks
+        self._work_cv       = threading.Condition()
+        self._work_gen      = 0
+
     # ================================================================
     # Seed Registration
     # ================================================================
@@ -76,8 +221,7 @@ class Node:
         all_peers = set()
         for seed_host, seed_port in self.seed_list:
             try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(5)
+                s = _new_tcp_sock(5)
                 s.connect((seed_host, seed_port))
                 s.send(json.dumps({"host": self.host, "port": self.port}).encode())
                 peer_list = json.loads(s.recv(4096).decode())
@@ -96,45 +240,75 @@ class Node:
     # ================================================================
 
     def start_server(self):
+        """
+        Single-threaded selector (epoll) loop: accepts connections and
+        reads frames without blocking, then hands each complete message
+        to a small worker pool instead of starting a thread per connection.
+        """
         server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server.bind((self.host, self.port))
         server.listen()
+        server.setblocking(False)
         print(f"[NODE {self.port}] Listening...")
+
+        sel = selectors.DefaultSelector()
+        sel.register(server, selectors.EVENT_READ, data=None)
+        workers = ThreadPoolExecutor(max_workers=SERVER_WORKERS)
+
         while True:
-            conn, addr = server.accept()
-            threading.Thread(target=self.handle_message,
-                             args=(conn,), daemon=True).start()
+            for key, _ in sel.select():
+                if key.data is None:
+                    try:
+                        conn, addr = server.accept()
+                    except (BlockingIOError, InterruptedError):
+                        continue   # the client went away before accept
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    # Timeout mode, not non-blocking: the loop only recv()s
+                    # once the selector reports data, so it never waits, but
+                    # workers' sendall() must wait for send-buffer space when
+                    # a reply (e.g. CHAIN_RESPONSE) outgrows it
+                    conn.settimeout(REPLY_TIMEOUT)
+                    sel.register(conn, selectors.EVENT_READ, data=_FrameReader())
+                    continue
+
+                conn, reader = key.fileobj, key.data
+                try:
+                    chunk = conn.recv(65536)
+                    messages = reader.feed(chunk) if chunk else []
+                except (OSError, ValueError) as e:
+                    print(f"[NODE {self.port}] recv error: {e}")
+                    chunk, messages = b"", []
+
+                for message in messages:
+                    with reader.lock:
+                        reader.inflight += 1
+                    workers.submit(self._serve_message, conn, reader, message)
+                if not chunk:
+                    sel.unregister(conn)
+                    reader.done(conn, eof=True)
+
+    def _serve_message(self, conn, reader, message):
+        """Worker-side wrapper: dispatches, then releases conn to the reader."""
+        try:
+            self._dispatch_message(conn, message)
+        finally:
+            reader.done(conn)
 
     # ================================================================
     # Message Handler
     # ================================================================
 
-    def handle_message(self, conn):
+    def _dispatch_message(self, conn, message):
+        """Acts on one decoded message; the caller owns (and closes) conn."""
         try:
-            raw = b""
-            while True:
-                chunk = conn.recv(65536)
-                if not chunk:
-                    break
-                raw += chunk
-                try:
-                    message = json.loads(raw.decode())
-                    break
-                except json.JSONDecodeError:
-                    continue
-
-            if not raw:
-                return
-
-            message = json.loads(raw.decode())
             msg_type = message.get("type")
 
             # ---- LIVENESS PING ----
             if msg_type == "LIVENESS":
-                conn.send(json.dumps({"type": "ALIVE",
-                                      "ip": self.host,
-                                      "port": self.port}).encode())
+                _send_framed(conn, {"type": "ALIVE",
+                                    "ip": self.host,
+                                    "port": self.port})
                 return
 
             # ---- CHAIN REQUEST (sync) ----
@@ -149,10 +323,8 @@ class Node:
             # ---- Gossip dedup ----
             if "id" not in message:
                 return
-            msg_id = message["id"]
-            if msg_id in self.seen_messages:
+            if self._seen_add(message["id"]):
                 return
-            self.seen_messages.add(msg_id)
 
             # ---- TX ----
             if msg_type == "TX":
@@ -172,8 +344,20 @@ class Node:
 
         except Exception as e:
             print(f"[NODE {self.port}] handle_message error: {e}")
-        finally:
-            conn.close()
+
+    def _seen_add(self, msg_id):
+        """
+        Records a gossip id in the bounded seen_messages LRU.
+        Returns True if it had already been seen.
+        """
+        with self._seen_lock:
+            if msg_id in self.seen_messages:
+                self.seen_messages.move_to_end(msg_id)
+                return True
+            self.seen_messages[msg_id] = None
+            if len(self.seen_messages) > SEEN_MESSAGES_MAX:
+                self.seen_messages.popitem(last=False)
+            return False
 
     # ================================================================
     # TX handling
@@ -181,9 +365,9 @@ class Node:
 
     def _handle_tx(self, message):
         td = message["data"]
-        tx = Transaction(None, tuple(td["sender_pk"]),
+        tx = Transaction(None, base64.b64decode(td["sender_pk"]),
                          td["receiver_addr"], td["data"])
-        tx.signature = tuple(td["signature"])
+        tx.signature = base64.b64decode(td["signature"])
         tx.txid      = td.get("txid", tx.txid)
 
         if tx.verify():
@@ -198,6 +382,20 @@ class Node:
     # Block handling – per assignment spec
     # ================================================================
 
+    def _block_verify_pool(self, n_tx):
+        """
+        Thread pool for verifying a block of n_tx transactions, or None when
+        verify_all would stay serial anyway (below PARALLEL_MIN_ROWS, as every
+        TX_PER_BLOCK block is, or a single CPU).  The pool is only started
+        the first time a block that large arrives.
+        """
+        if n_tx < PARALLEL_MIN_ROWS or VERIFY_WORKERS < 2:
+            return None
+        with self._verify_pool_lock:
+            if self._verify_pool is None:
+                self._verify_pool = ThreadPoolExecutor(max_workers=VERIFY_WORKERS)
+            return self._verify_pool
+
     def _handle_block(self, message):
         """
         On receiving a block:
@@ -205,29 +403,36 @@ class Node:
           2. Insert into pending_queue.
           3. Abort current mining if the received block extends a longer chain.
         """
-        from core.block import Block
-
         print(f"[NODE {self.port}] Received BLOCK message")
 
         block = Block.from_dict(message["data"])
 
+        # -- Hash validation: the id others link to must match the header --
+        if block.hash != block.compute_hash():
+            print(f"[NODE {self.port}] Block rejected: hash does not match header")
+            return
+
         # -- Timestamp validation (±1 hour) --
-        if abs(block.timestamp - time.time()) > 3600:
+        if abs(block.timestamp - time.time_ns()) > 3600 * 10**9:
             print(f"[NODE {self.port}] Block rejected: timestamp out of range")
             return
 
         # -- TX signature validation --
-        for tx in block.transactions:
-            if not tx.verify():
-                print(f"[NODE {self.port}] Block rejected: invalid TX signature")
-                return
+        pool = self._block_verify_pool(len(block.transactions))
+        if not TxBatch(block.transactions).verify_all(pool, VERIFY_WORKERS):
+            print(f"[NODE {self.port}] Block rejected: invalid TX signature")
+            return
 
         # -- Track in block_index --
-        self.block_index[block.hash] = block
+        self._index_block(block)
 
-        # -- Add to pending_queue --
+        # -- Add to pending_queue (once per block hash) --
         with self._queue_lock:
+            if block.hash in self._pending_hashes:
+                return
             self.pending_queue.append(block)
+            self._pending_hashes.add(block.hash)
+        self._notify_work()
         print(f"[NODE {self.port}] Block {block.hash[:12]}… queued "
               f"(pending={len(self.pending_queue)})")
 
@@ -238,28 +443,56 @@ class Node:
                   f" – aborting mining")
             self.miner.abort()
 
+    def _index_block(self, block):
+        """
+        Adds block to block_index and records its height: one more than
+        its parent's, or 1 if the parent is unknown. Blocks that arrived
+        before this one (its indexed descendants) are re-heighted on top
+        of it, so out-of-order delivery never leaves a stale short height
+        and _candidate_chain_length stays O(1) without a walk to genesis.
+        """
+        with self._index_lock:
+            if block.hash in self.block_index:
+                return
+            self.block_index[block.hash] = block
+            self._block_children.setdefault(block.prev_hash, []).append(block.hash)
+
+            stack = [(block.hash, self.block_height.get(block.prev_hash, 0) + 1)]
+            seen = set()   # guards against parent links that form a cycle
+            while stack:
+                h, height = stack.pop()
+                if h in seen:
+                    continue
+                seen.add(h)
+                self.block_height[h] = height
+                stack.extend((child, height + 1)
+                             for child in self._block_children.get(h, ()))
+
     def _candidate_chain_length(self, tip_block):
         """Estimate the length of a chain ending at tip_block."""
-        length = 1
-        ph = tip_block.prev_hash
-        while ph in self.block_index:
-            length += 1
-            ph = self.block_index[ph].prev_hash
-        # Add genesis offset
-        return length
+        height = self.block_height.get(tip_block.hash)
+        if height is None:
+            height = self.block_height.get(tip_block.prev_hash, 0) + 1
+        return height
 
     # ================================================================
     # Chain sync
     # ================================================================
 
     def _handle_chain_response(self, message):
-        from core.block import Block
         new_chain = [Block.from_dict(b) for b in message["chain"]]
+        if any(b.hash != b.compute_hash() for b in new_chain) or any(
+                b.prev_hash != parent.hash
+                for parent, b in zip(new_chain, new_chain[1:])):
+            print(f"[NODE {self.port}] Chain response rejected: bad hash or link")
+            return
         if len(new_chain) > len(self.blockchain.chain):
-            self.blockchain.chain = new_chain
-            # Rebuild block_index
+            self.blockchain.replace_chain(new_chain)
+            # Index genesis-first: each block's height is its 1-based
+            # position, and blocks gossiped ahead of the sync (e.g. Bk)
+            # are re-heighted as their parents are indexed
             for b in new_chain:
-                self.block_index[b.hash] = b
+                self._index_block(b)
             print(f"[NODE {self.port}] Chain synced to height {len(new_chain)}")
 
     def _send_chain(self, conn):
@@ -267,7 +500,7 @@ class Node:
             "type": "CHAIN_RESPONSE",
             "chain": [b.to_dict() for b in self.blockchain.chain]
         }
-        conn.send(json.dumps(response).encode())
+        _send_framed(conn, response)
 
     def request_chain_sync(self):
         """
@@ -279,29 +512,15 @@ class Node:
             self._syncing = False
             return
 
-        peer = list(self.peers)[0]
+        peer = self._peer_index[0][0]
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(SYNC_TIMEOUT)
+            s = _new_tcp_sock(SYNC_TIMEOUT)
             s.connect(peer)
-            s.send(json.dumps({"type": "CHAIN_REQUEST"}).encode())
-
-            raw = b""
-            s.settimeout(SYNC_TIMEOUT)
-            while True:
-                chunk = s.recv(65536)
-                if not chunk:
-                    break
-                raw += chunk
-                try:
-                    msg = json.loads(raw.decode())
-                    break
-                except json.JSONDecodeError:
-                    continue
+            _send_framed(s, {"type": "CHAIN_REQUEST"})
+            msg = _recv_framed(s)
             s.close()
 
-            if raw:
-                msg = json.loads(raw.decode())
+            if msg is not None:
                 self._handle_chain_response(msg)
 
         except Exception as e:
@@ -314,18 +533,67 @@ class Node:
     # Gossip
     # ================================================================
 
+    @property
+    def peers(self):
+        return self._peers
+
+    @peers.setter
+    def peers(self, peers):
+        """
+        Replaces the peer set and rebuilds the (tuple, peer -> index) pair
+        gossip iterates, swapped in as one reference so readers never see
+        a tuple and index from different generations.
+        """
+        self._peers = frozenset(peers)
+        # Each peer gets its send lock and (lazily connected) socket slot
+        # here, once, instead of on every send
+        for peer in self._peers:
+            if peer not in self._peer_locks:
+                self._peer_locks[peer] = threading.Lock()
+                self._peer_conns[peer] = None
+        peer_tuple = tuple(self._peers)
+        self._peer_index = (peer_tuple,
+                            {p: i for i, p in enumerate(peer_tuple)})
+
     def gossip(self, message, sender=None):
-        for peer in list(self.peers):
-            if peer == sender:
-                continue
-            try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(3)
-                s.connect(peer)
-                s.send(json.dumps(message).encode())
-                s.close()
-            except:
-                pass
+        """Encodes message once and gossips the same frame to every peer."""
+        self.gossip_bytes(_frame(message), sender)
+
+    def gossip_bytes(self, frame, sender=None):
+        """Fire-and-forget fan-out: one pool task per peer, not awaited."""
+        peer_tuple, peer_id = self._peer_index
+        skip = peer_id.get(sender, -1)
+        for i, peer in enumerate(peer_tuple):
+            if i != skip:
+                self._gossip_pool.submit(self._send_to_peer, peer, frame)
+
+    def _send_to_peer(self, peer, frame):
+        """
+        Sends one pre-encoded frame over the cached connection to peer.
+        A stale cached socket is dropped and the send retried once on a
+        fresh connection; returns False if the peer is unreachable.
+        """
+        lock = self._peer_locks.get(peer)
+        if lock is None:
+            return False   # no longer a peer
+        with lock:
+            for _ in range(2):
+                s = self._peer_conns.get(peer)
+                try:
+                    if s is not None and _peer_closed(s):
+                        s.close()
+                        s = None
+                    if s is None:
+                        s = _new_tcp_sock(3)
+                        s.connect(peer)
+                        self._peer_conns[peer] = s
+                    s.sendall(frame)
+                    return True
+                except OSError:
+                    if s is not None:
+                        s.close()
+                    self._peer_conns[peer] = None
+            return False
 
     def broadcast_tx(self, tx):
         self.msg_counter += 1
@@ -335,15 +603,9 @@ class Node:
             "ip":        self.host,
             "port":      self.port,
             "timestamp": time.time(),
-            "data": {
-                "sender_pk":    list(tx.sender_pk),
-                "receiver_addr": tx.receiver_addr,
-                "data":         tx.data,
-                "signature":    list(tx.signature),
-                "txid":         tx.txid,
-            }
+            "data":      tx.to_dict(),
         }
-        self.seen_messages.add(message["id"])
+        self._seen_add(message["id"])
         self.gossip(message)
 
     def broadcast_block(self, block):
@@ -356,7 +618,7 @@ class Node:
             "timestamp": time.time(),
             "data":      block.to_dict(),
         }
-        self.seen_messages.add(message["id"])
+        self._seen_add(message["id"])
         self.gossip(message)
 
     # ================================================================
@@ -375,36 +637,45 @@ class Node:
         Returns True if any block was processed.
         """
         processed = False
-        with self._queue_lock:
-            queue_snapshot = list(self.pending_queue)
+        deferred  = []   # blocks that cannot be applied yet stay queued
+
+        while True:
+            with self._queue_lock:
+                if not self.pending_queue:
+                    break
+                block = self.pending_queue.popleft()
+                self._pending_hashes.discard(block.hash)
 
-        for block in queue_snapshot:
             # Find if this block extends any known chain tip
             if block.prev_hash == self.blockchain.chain[-1].hash:
                 # Direct extension of current chain
-                self.blockchain.chain.append(block)
-                self.blockchain.save()
-                with self._queue_lock:
-                    if block in self.pending_queue:
-                        self.pending_queue.remove(block)
+                self.blockchain.append(block)
                 print(f"[NODE {self.port}] Block {block.hash[:12]}… "
                       f"appended (height={len(self.blockchain.chain)})")
                 self.broadcast_block(block)
                 processed = True
+                continue
 
-            elif block.prev_hash in self.block_index:
+            if block.prev_hash in self.block_index:
                 # Possible fork – check if it makes a longer chain
                 fork = self._build_fork_chain(block)
                 if len(fork) > len(self.blockchain.chain):
-                    self.blockchain.chain = fork
-                    self.blockchain.save()
-                    with self._queue_lock:
-                        if block in self.pending_queue:
-                            self.pending_queue.remove(block)
+                    self.blockchain.replace_chain(fork)
                     print(f"[NODE {self.port}] Switched to longer fork "
                           f"(height={len(fork)})")
                     self.broadcast_block(block)
                     processed = True
+                    continue
+
+            deferred.append(block)
+
+        # Put unapplied blocks back at the front, in their original order
+        if deferred:
+            with self._queue_lock:
+                for block in reversed(deferred):
+                    if block.hash not in self._pending_hashes:
+                        self.pending_queue.appendleft(block)
+                        self._pending_hashes.add(block.hash)
 
         # If pending_queue is now empty and we processed something,
         # signal miner to reset its timer (abort so mine_loop restarts)
@@ -414,14 +685,15 @@ class Node:
         return processed
 
     def _build_fork_chain(self, tip):
-        chain = [tip]
+        chain = [tip]   # built tip-first, reversed once at the end
         ph = tip.prev_hash
         while ph in self.block_index:
             parent = self.block_index[ph]
-            chain.insert(0, parent)
+            chain.append(parent)
             ph = parent.prev_hash
             if ph == "0":
                 break
+        chain.reverse()
         return chain
 
     # ================================================================
@@ -447,14 +719,18 @@ class Node:
               f"(hash_power={self.miner.hash_power}%)")
 
         while True:
+            gen = self._work_gen
+
             # 1. Drain the pending queue first
-            while len(self.pending_queue) > 0:
+            if self.pending_queue:
                 self.process_pending_queue()
-                time.sleep(0.2)
+                if self.pending_queue:   # only blocks still missing parents
+                    self._wait_for_work(gen, 0.2)
+                continue
 
             # 2. Need transactions to mine
             if self.mempool.is_empty():
-                time.sleep(1)
+                self._wait_for_work(gen, 1.0)
                 continue
 
             # 3. Start mining
@@ -463,7 +739,7 @@ class Node:
 
             if not txs:
                 self._mining_active = False
-                time.sleep(1)
+                self._wait_for_work(gen, 1.0)
                 continue
 
             print(f"[NODE {self.port}] Starting mining "
@@ -477,11 +753,9 @@ class Node:
                 # -- Timer expired: we found the block --
                 # Mine on the longest chain
                 prev_hash = self.blockchain.chain[-1].hash
-                from core.block import Block
                 new_block = Block(prev_hash, txs)
-                self.blockchain.chain.append(new_block)
-                self.blockchain.save()
-                self.block_index[new_block.hash] = new_block
+                self.blockchain.append(new_block)
+                self._index_block(new_block)
 
                 # Remove mined txids from mempool (in case some leaked back)
                 self.mempool.remove([tx.txid for tx in txs])
@@ -499,6 +773,17 @@ class Node:
                 print(f"[NODE {self.port}] Mining aborted – txs returned to mempool")
                 # Process pending queue (will be drained at top of loop)
 
+    def _notify_work(self):
+        """Wakes mine_loop: a block was queued or a tx entered the mempool."""
+        with self._work_cv:
+            self._work_gen += 1
+            self._work_cv.notify_all()
+
+    def _wait_for_work(self, gen, timeout):
+        """Parks until _notify_work() runs after `gen` was read, or timeout."""
+        with self._work_cv:
+            self._work_cv.wait_for(lambda: self._work_gen != gen, timeout)
+
     # ================================================================
     # Liveness
     # ================================================================
@@ -506,17 +791,16 @@ class Node:
     def liveness_loop(self):
         while True:
             time.sleep(13)
-            for peer in list(self.peers):
+            for peer in self._peer_index[0]:
                 try:
-                    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    s.settimeout(3)
+                    s = _new_tcp_sock(3)
                     s.connect(peer)
-                    s.send(json.dumps({
+                    _send_framed(s, {
                         "type": "LIVENESS",
                         "ip":   self.host,
                         "port": self.port,
                         "time": time.time()
-                    }).encode())
+                    })
                     s.close()
                     self.liveness[peer] = 0   # reset on success
                 except:
@@ -526,15 +810,14 @@ class Node:
                     if fails >= 3:
                         print(f"[NODE {self.port}] DEAD detected: {peer}")
                         self._report_dead(peer)
-                        self.peers.discard(peer)
+                        self.peers = self.peers - {peer}
 
     def _report_dead(self, dead_peer):
         msg = (f"Dead Node:{dead_peer[0]}:{dead_peer[1]}"
                f":{time.time()}:{self.host}")
         for seed in self.seed_list:
             try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(3)
+                s = _new_tcp_sock(3)
                 s.connect(seed)
                 s.send(msg.encode())
                 s.close()
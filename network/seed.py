@@ -4,6 +4,7 @@ import json
 import sys
 
 peers = set()
+peers_lock = threading.Lock()
 
 
 def handle_client(conn):
@@ -24,8 +25,10 @@ def handle_client(conn):
     # NORMAL REGISTRATION
     try:
         peer = json.loads(data)
-        peers.add((peer["host"], peer["port"]))
-        conn.send(json.dumps(list(peers)).encode())
+        with peers_lock:
+            peers.add((peer["host"], peer["port"]))
+            snapshot = list(peers)
+        conn.send(json.dumps(snapshot).encode())
     except:
         pass
 
@@ -14,17 +14,24 @@ Part 2 — Lambda vs Hash Power:
 
 Run from the project root:
     python3 plots/task7_stochastic_analysis.py
+Set MPL_SHOW=1 to also open the figure window (default: save PNG only).
 """
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-import random
 import numpy as np
+import matplotlib
+
+# Only the PNG is needed by default: skip GUI backend probing unless the
+# figure window is requested with MPL_SHOW=1
+SHOW_PLOT = os.environ.get("MPL_SHOW") == "1"
+if not SHOW_PLOT:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-from scipy.stats import expon
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Parameters (matching the assignment spec exactly)
@@ -33,13 +40,15 @@ from scipy.stats import expon
 INTERARRIVAL   = 10.0      # target network-wide average block interval (seconds)
 HASH_POWER_FIXED = 30.0   # fixed hash power for Part 1 (%)
 NUM_CYCLES     = 100       # number of mining cycles to simulate
+RNG_SEED       = 12345     # fixed so reruns reproduce the same figure
 
 # Derived from spec:
 #   meanTk = 1.0 / interarrival
 #   lambda = nodeHashPower * meanTk / 100.0
-#   Tk     = random.expovariate(lambda)
+#   Tk     ~ Exp(lambda)   (drawn as one NumPy array)
 
 meanTk = 1.0 / INTERARRIVAL
+rng    = np.random.default_rng(RNG_SEED)   # PCG64, shared by every draw
 
 
 def compute_lambda(hash_power):
@@ -49,8 +58,7 @@ def compute_lambda(hash_power):
 
 def simulate_mining_cycles(hash_power, n_cycles):
     """Draw n_cycles exponential waiting times for a given hash power."""
-    lam = compute_lambda(hash_power)
-    return [random.expovariate(lam) for _ in range(n_cycles)]
+    return rng.exponential(scale=1.0 / compute_lambda(hash_power), size=n_cycles)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -78,12 +86,17 @@ mean_obs   = np.mean(samples)
 std_obs    = np.std(samples)
 mean_theo  = 1.0 / lam_fixed   # E[Tk] = 1/lambda
 
-# Histogram (normalised to density so PDF overlays correctly)
+# Histogram (normalised to density so PDF overlays correctly).  An explicit
+# range gives equal-width bins, so np.histogram takes its O(N) path.
 n_bins = 15
-counts, bin_edges, patches = ax1.hist(
-    samples,
-    bins=n_bins,
-    density=True,
+counts, bin_edges = np.histogram(samples, bins=n_bins,
+                                 range=(0.0, float(samples.max())),
+                                 density=True)
+ax1.bar(
+    bin_edges[:-1],
+    counts,
+    width=np.diff(bin_edges),
+    align="edge",
     color="#4C72B0",
     edgecolor="white",
     linewidth=0.6,
@@ -92,7 +105,8 @@ counts, bin_edges, patches = ax1.hist(
 )
 
 # Theoretical PDF: f(t) = λ · e^(−λt)
-t_range = np.linspace(0, max(samples) * 1.1, 500)
+tmax    = float(samples.max()) * 1.1
+t_range = np.linspace(0.0, tmax, 128)   # ample for a smooth exponential
 pdf     = lam_fixed * np.exp(-lam_fixed * t_range)
 ax1.plot(t_range, pdf, color="#C44E52", linewidth=2.2,
          label=f"Theoretical PDF  f(t)=λe$^{{-λt}}$")
@@ -113,18 +127,6 @@ ax1.set_ylabel("Probability Density", fontsize=10)
 ax1.legend(fontsize=8.5)
 ax1.grid(axis="y", linestyle="--", alpha=0.4)
 
-# Annotation box
-textstr = (
-    f"λ  = {lam_fixed:.5f}\n"
-    f"E[Tk] = 1/λ = {mean_theo:.2f}s\n"
-    f"Obs mean  = {mean_obs:.2f}s\n"
-    f"Obs std   = {std_obs:.2f}s"
-)
-ax1.text(0.97, 0.97, textstr, transform=ax1.transAxes,
-         fontsize=8, verticalalignment="top", horizontalalignment="right",
-         bbox=dict(boxstyle="round,pad=0.4", facecolor="lightyellow",
-                   edgecolor="gray", alpha=0.9))
-
 # ─────────────────────────────────────────────────────────────────────────────
 # PART 2 — Lambda vs Hash Power
 # ─────────────────────────────────────────────────────────────────────────────
@@ -176,19 +178,19 @@ ax2.set_title(
 )
 ax2.grid(linestyle="--", alpha=0.4)
 
-# Annotation box
-textstr2 = (
-    f"Formula:\n"
-    f"  λ = (hp × meanTk) / 100\n"
-    f"  E[Tk] = 1 / λ\n\n"
-    f"At hp=1%:  λ={compute_lambda(1):.5f},  E[Tk]={1/compute_lambda(1):.1f}s\n"
-    f"At hp=50%: λ={compute_lambda(50):.5f},  E[Tk]={1/compute_lambda(50):.1f}s\n"
-    f"At hp=100%:λ={compute_lambda(100):.5f},  E[Tk]={1/compute_lambda(100):.1f}s"
+# ─────────────────────────────────────────────────────────────────────────────
+# Parameter summary — one figure-level text instead of a boxed text per axes
+# ─────────────────────────────────────────────────────────────────────────────
+
+summary = (
+    f"Part 1:  λ = {lam_fixed:.5f},  E[Tk] = 1/λ = {mean_theo:.2f}s,  "
+    f"observed mean = {mean_obs:.2f}s,  observed std = {std_obs:.2f}s\n"
+    f"Part 2:  λ = (hp × meanTk) / 100,  E[Tk] = 1/λ  —  "
+    f"hp=1%: λ={lambdas[0]:.5f}, E[Tk]={expected_waits[0]:.1f}s;  "
+    f"hp=50%: λ={lambdas[49]:.5f}, E[Tk]={expected_waits[49]:.1f}s;  "
+    f"hp=100%: λ={lambdas[99]:.5f}, E[Tk]={expected_waits[99]:.1f}s"
 )
-ax2.text(0.97, 0.35, textstr2, transform=ax2.transAxes,
-         fontsize=7.5, verticalalignment="top", horizontalalignment="right",
-         bbox=dict(boxstyle="round,pad=0.4", facecolor="lightyellow",
-                   edgecolor="gray", alpha=0.9))
+fig.text(0.01, -0.02, summary, fontsize=8, verticalalignment="top")
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Save and show
@@ -214,13 +216,17 @@ print(f"  Observed mean    : {mean_obs:.4f} s")
 print(f"  Observed std     : {std_obs:.4f} s")
 print(f"  Relative error   : {abs(mean_obs - mean_theo)/mean_theo * 100:.2f}%")
 
-print(f"\nPart 2: Lambda vs Hash Power")
-print(f"  {'Hash Power':>12} | {'Lambda':>12} | {'E[Tk] (s)':>12}")
-print(f"  {'-'*12}-+-{'-'*12}-+-{'-'*12}")
-for hp in [1, 10, 20, 30, 50, 75, 100]:
-    lam = compute_lambda(hp)
-    etk = 1.0 / lam
-    print(f"  {hp:>11}% | {lam:>12.6f} | {etk:>11.2f}s")
+hp_arr  = np.array([1, 10, 20, 30, 50, 75, 100])
+lam_arr = (hp_arr * meanTk) / 100.0
+etk_arr = 1.0 / lam_arr
+table = [
+    f"\nPart 2: Lambda vs Hash Power",
+    f"  {'Hash Power':>12} | {'Lambda':>12} | {'E[Tk] (s)':>12}",
+    f"  {'-'*12}-+-{'-'*12}-+-{'-'*12}",
+]
+table += [f"  {hp:>11}% | {lam:>12.6f} | {etk:>11.2f}s"
+          for hp, lam, etk in zip(hp_arr, lam_arr, etk_arr)]
+print("\n".join(table))   # one write for the whole table
 
 print(f"""
 Answer to Assignment Question:
@@ -235,12 +241,13 @@ more frequently. Specifically:
   E[Tk] = 1/λ
 
 So doubling hash power doubles λ, and halves the average waiting
-time. A node with 50% hash power (λ={compute_lambda(50):.4f}) expects
-to wait only {1/compute_lambda(50):.1f}s on average, while a node with 1%
-hash power (λ={compute_lambda(1):.4f}) waits on average {1/compute_lambda(1):.1f}s.
+time. A node with 50% hash power (λ={lambdas[49]:.4f}) expects
+to wait only {expected_waits[49]:.1f}s on average, while a node with 1%
+hash power (λ={lambdas[0]:.4f}) waits on average {expected_waits[0]:.1f}s.
 
 This correctly models the proportional mining advantage of nodes
 with greater computational resources in a PoW network.
 """)
 
-plt.show()
+if SHOW_PLOT:
+    plt.show()
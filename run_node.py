@@ -0,0 +1,55 @@
+"""
+run_node.py – Parameterized Peer Node launcher
+Shared entry point for every node role; run_node1..5.py call run() with
+their own port / hash power / transaction settings.
+
+Usage:
+    python3 run_node.py --port 9001 --hash-power 30 --seed-tx 6 --tx-interval 18
+"""
+import argparse
+import time
+
+from network.node import Node
+
+SEED_LIST = [
+    ("127.0.0.1", 8000),
+    ("127.0.0.1", 8001),
+    ("127.0.0.1", 8002),
+]
+
+
+def run(port, hash_power, seed_tx_count, tx_gen_interval, interarrival=15.0):
+    """Starts one node and prints a heartbeat every 5 seconds (never returns)."""
+    node = Node(
+        host         = "127.0.0.1",
+        port         = port,
+        seed_list    = SEED_LIST,
+        hash_power   = hash_power,
+        interarrival = interarrival,
+    )
+    node.start(seed_tx_count=seed_tx_count, tx_gen_interval=tx_gen_interval)
+
+    while True:
+        time.sleep(5)
+        height  = len(node.blockchain.chain)
+        mempool = node.mempool.size()
+        pending = len(node.pending_queue)
+        print(f"[NODE {port}] Chain height={height} "
+              f"mempool={mempool} pending={pending}")
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description="Start one peer node.")
+    p.add_argument("--port", type=int, required=True)
+    p.add_argument("--hash-power", type=float, required=True,
+                   help="percentage of network hash power (0-100]")
+    p.add_argument("--seed-tx", type=int, default=5,
+                   help="transactions seeded into the mempool at startup")
+    p.add_argument("--tx-interval", type=int, default=20,
+                   help="seconds between locally generated transactions")
+    p.add_argument("--interarrival", type=float, default=15.0,
+                   help="target network-wide block interval (seconds)")
+    args = p.parse_args()
+
+    run(args.port, args.hash_power, args.seed_tx, args.tx_interval,
+        args.interarrival)
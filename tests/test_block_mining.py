@@ -32,7 +32,8 @@ R19. mempool.take() removes transactions from pool
 R20. mempool.remove() purges confirmed txids
 """
 
-import sys, os, time, threading, json, tempfile
+import sys, os, re, time, threading, json, tempfile, copy, itertools
+from collections import deque
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from core.crypto_identity import generate_keypair, address_from_pk
@@ -41,31 +42,56 @@ from core.block import Block
 from core.blockchain import Blockchain
 from core.mempool import Mempool
 from mining.pow_miner import Miner
+from network.node import Node
 
 # ────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────────────────────────────────
 
+# Keypairs generated once and reused round-robin by make_tx; tests that
+# exercise signatures themselves (R16) still generate their own keys
+_KEYPAIRS = [generate_keypair() for _ in range(8)]
+_ADDRS    = [address_from_pk(pk) for _, pk in _KEYPAIRS]
+_KEY_IDX  = itertools.count()
+
 def make_tx(data="100 barrels delivered"):
-    sk, pk = generate_keypair()
-    receiver = address_from_pk(generate_keypair()[1])
+    i = next(_KEY_IDX)
+    sk, pk = _KEYPAIRS[i % len(_KEYPAIRS)]
+    receiver = _ADDRS[(i + 1) % len(_KEYPAIRS)]
     return Transaction(sk, pk, receiver, data)
 
+# One Mempool shared by the tests, emptied with reset() between them rather
+# than rebuilt (each construction generates a node keypair)
+_MEMPOOL = None
+
+def fresh_mempool():
+    global _MEMPOOL
+    if _MEMPOOL is None:
+        _MEMPOOL = Mempool(node_port=9999)
+    else:
+        _MEMPOOL.reset()
+    return _MEMPOOL
+
 def make_block(prev_hash="0", n_tx=2):
     txs = [make_tx(f"tx-{i}") for i in range(n_tx)]
     return Block(prev_hash, txs)
 
 PASS = "\033[32mPASS\033[0m"
 FAIL = "\033[31mFAIL\033[0m"
-_results = []
+_passed = 0
+_failed = []            # names of failed checks; the total is _passed + len(_failed)
 
 def check(name, condition, detail=""):
+    global _passed
     status = PASS if condition else FAIL
     line = f"  [{status}] {name}"
     if detail:
         line += f"\n           {detail}"
     print(line)
-    _results.append((name, bool(condition)))
+    if condition:
+        _passed += 1
+    else:
+        _failed.append(name)
     return bool(condition)
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -73,7 +99,11 @@ def check(name, condition, detail=""):
 # ────────────────────────────────────────────────────────────────────────────
 
 class MockNode:
-    """Minimal node for unit testing – no real sockets."""
+    """
+    Minimal node for unit testing – no real sockets.  Pending-queue
+    handling is Node's own code, run against the same deque + hash-set
+    state; only networking, disk and mining are stubbed.
+    """
 
     def __init__(self, hash_power=20, interarrival=0.5):
         self.host       = "127.0.0.1"
@@ -87,7 +117,8 @@ class MockNode:
         self.blockchain.chain = [genesis]
 
         self.block_index    = {genesis.hash: genesis}
-        self.pending_queue  = []
+        self.pending_queue  = deque()   # same structures as Node
+        self._pending_hashes = set()
         self._queue_lock    = threading.Lock()
         self.mempool        = Mempool(node_port=0)
         self.miner          = Miner(hash_power=hash_power,
@@ -101,46 +132,17 @@ class MockNode:
     def broadcast_block(self, block):
         self._broadcasts.append(block)
 
-    def process_pending_queue(self):
-        """Mirror of Node.process_pending_queue."""
-        processed = False
+    def queue(self, *blocks):
+        """Adds blocks to pending_queue once per hash (as _handle_block does)."""
         with self._queue_lock:
-            snapshot = list(self.pending_queue)
-
-        for block in snapshot:
-            if block.prev_hash == self.blockchain.chain[-1].hash:
-                self.blockchain.chain.append(block)
-                with self._queue_lock:
-                    if block in self.pending_queue:
-                        self.pending_queue.remove(block)
-                self.broadcast_block(block)
-                processed = True
-
-            elif block.prev_hash in self.block_index:
-                fork = self._build_fork_chain(block)
-                if len(fork) > len(self.blockchain.chain):
-                    self.blockchain.chain = fork
-                    with self._queue_lock:
-                        if block in self.pending_queue:
-                            self.pending_queue.remove(block)
-                    self.broadcast_block(block)
-                    processed = True
-
-        if processed and len(self.pending_queue) == 0:
-            self.miner.abort()
-
-        return processed
-
-    def _build_fork_chain(self, tip):
-        chain = [tip]
-        ph = tip.prev_hash
-        while ph in self.block_index:
-            parent = self.block_index[ph]
-            chain.insert(0, parent)
-            ph = parent.prev_hash
-            if ph == "0":
-                break
-        return chain
+            for block in blocks:
+                if block.hash not in self._pending_hashes:
+                    self.pending_queue.append(block)
+                    self._pending_hashes.add(block.hash)
+
+    # The production queue logic itself, run against this node's state
+    process_pending_queue = Node.process_pending_queue
+    _build_fork_chain     = Node._build_fork_chain
 
     def mine_loop_one_cycle(self):
         """Run exactly one mining attempt (for test isolation)."""
@@ -174,6 +176,10 @@ class _MemoryBlockchain:
     """Blockchain that never touches disk."""
     def __init__(self):
         self.chain = []
+    def append(self, block):
+        self.chain.append(block)
+    def replace_chain(self, blocks):
+        self.chain = list(blocks)
     def save(self):
         pass
 
@@ -200,11 +206,11 @@ def test_lambda_and_waiting_time():
           (1/m2.lam) < (1/m.lam),
           f"E[Tk] hp=40: {1/m2.lam:.2f}s  hp=20: {1/m.lam:.2f}s")
 
-    samples = [m.sample_wait_time() for _ in range(200)]
+    samples = m.sample_wait_times(200)
     check("R1: all samples > 0",
-          all(s > 0 for s in samples))
+          bool((samples > 0).all()))
 
-    mean_obs  = sum(samples)/len(samples)
+    mean_obs  = float(samples.mean())
     mean_theo = 1.0 / m.lam
     rel_err   = abs(mean_obs - mean_theo) / mean_theo
     check("R1: sample mean within 30% of theoretical E[Tk]",
@@ -281,10 +287,17 @@ def test_fresh_draw_after_abort():
 def test_pending_queue_unbounded():
     print("\n── R8: pending_queue unbounded ──")
     node = MockNode()
-    blocks = [make_block("0") for _ in range(100)]
+    # 100 distinct block objects; only their hashes need to differ, so
+    # shallow-copy one empty block instead of signing 200 transactions
+    proto = Block("0", [])
+    blocks = [proto]
+    for i in range(99):
+        b = copy.copy(proto)
+        b.hash = f"{proto.hash}_{i}"
+        blocks.append(b)
     for b in blocks:
         node.block_index[b.hash] = b
-        node.pending_queue.append(b)
+        node.queue(b)
     check("R8: pending_queue holds 100 blocks",
           len(node.pending_queue) == 100)
 
@@ -295,7 +308,7 @@ def test_process_pending_appends_block():
     genesis_hash = node.blockchain.chain[0].hash
     b1 = make_block(prev_hash=genesis_hash)
     node.block_index[b1.hash] = b1
-    node.pending_queue.append(b1)
+    node.queue(b1)
 
     node.process_pending_queue()
 
@@ -315,7 +328,7 @@ def test_abort_triggered_on_longer_chain():
     for b in [b1, b2, b3]:
         node.block_index[b.hash] = b
 
-    node.pending_queue.extend([b1, b2, b3])
+    node.queue(b1, b2, b3)
 
     abort_called = [False]
     orig = node.miner.abort
@@ -434,13 +447,17 @@ def test_longest_chain_rule():
     for b in [a1, a2, b1, b2, b3]:
         node.block_index[b.hash] = b
 
-    node.pending_queue.extend([a1, a2, b1, b2, b3])
+    node.queue(a1, a2, b1, b2, b3)
     for _ in range(8):
         node.process_pending_queue()
 
     check("R14: node adopts longest chain (height >= 4)",
           len(node.blockchain.chain) >= 4,
           f"chain height={len(node.blockchain.chain)}")
+    check("R14b: chain tip is the longer fork's tip, stale blocks queued once",
+          node.blockchain.chain[-1].hash == b3.hash and
+          len(node.pending_queue) == len(node._pending_hashes),
+          f"pending={len(node.pending_queue)}")
 
 
 # ============================================================================
@@ -450,15 +467,16 @@ def test_longest_chain_rule():
 def test_timestamp_validation():
     print("\n── R15: Block timestamp validation ──")
 
-    def _ts_valid(block):
-        return abs(block.timestamp - time.time()) <= 3600
+    def _ts_valid(block, now):
+        return abs(block.timestamp - now) <= 3600 * 10**9
 
     good = make_block("0")
     bad  = make_block("0")
-    bad.timestamp = time.time() - 7200  # 2 hours ago
+    now  = time.time_ns()   # one clock read for the whole check pass
+    bad.timestamp = now - 7200 * 10**9  # 2 hours ago
 
-    check("R15a: valid timestamp (now) accepted", _ts_valid(good))
-    check("R15b: stale timestamp (2h ago) rejected", not _ts_valid(bad))
+    check("R15a: valid timestamp (now) accepted", _ts_valid(good, now))
+    check("R15b: stale timestamp (2h ago) rejected", not _ts_valid(bad, now))
 
 
 # ============================================================================
@@ -484,27 +502,36 @@ def test_tx_signature_validation():
 # R17-R20: Mempool tests
 # ============================================================================
 
+# All R17c keywords as one alternation: a single pass over the corpus
+# (every pooled tx's lowercased data) instead of one scan per keyword
+_PETROLEUM_KEYWORDS = re.compile("|".join(map(re.escape, [
+    "barrel", "refin", "tanker", "pipeline", "shipment",
+    "invoice", "payment", "delivery", "extraction",
+    "exploration", "well", "crude", "fuel", "royalty",
+    "cargo", "bbl", "storage", "pump"])))
+
 def test_mempool_seeds_petroleum_txs():
     print("\n── R17: Mempool seeds petroleum transactions ──")
-    mp = Mempool(node_port=9999)
+    mp = fresh_mempool()
     txs = mp.seed_initial_transactions(count=5)
 
     check("R17a: 5 transactions seeded", len(txs) == 5)
     check("R17b: mempool size == 5", mp.size() == 5)
 
-    keywords = ["barrel", "refin", "tanker", "pipeline", "shipment",
-                "invoice", "payment", "delivery", "extraction",
-                "exploration", "well", "crude", "fuel", "royalty",
-                "cargo", "bbl", "storage", "pump"]
-    corpus = " ".join(tx.data.lower() for tx in txs)
+    corpus = " ".join(tx.data for tx in mp.peek()).lower()
+    hit = _PETROLEUM_KEYWORDS.search(corpus)
     check("R17c: data contains petroleum keywords",
-          any(kw in corpus for kw in keywords),
-          f"sample: {txs[0].data}")
+          hit is not None,
+          f"matched: {hit and hit.group()}  sample: {txs[0].data}")
+
+    runs = [[tx.data for tx in Mempool(node_port=9999, seed=7)
+             .seed_initial_transactions(count=3)] for _ in range(2)]
+    check("R17d: fixed mempool seed reproduces tx data", runs[0] == runs[1])
 
 
 def test_mempool_dedup():
     print("\n── R18: Mempool deduplication ──")
-    mp = Mempool(node_port=9999)
+    mp = fresh_mempool()
     tx = make_tx("100 barrels")
     mp.add(tx)
     again = mp.add(tx)
@@ -515,7 +542,7 @@ def test_mempool_dedup():
 
 def test_mempool_take():
     print("\n── R19: Mempool take() ──")
-    mp = Mempool(node_port=9999)
+    mp = fresh_mempool()
     for i in range(10):
         mp.add(make_tx(f"event-{i}"))
 
@@ -526,18 +553,23 @@ def test_mempool_take():
 
 def test_mempool_remove():
     print("\n── R20: Mempool remove() ──")
-    mp = Mempool(node_port=9999)
+    mp = fresh_mempool()
     txs = [make_tx(f"item-{i}") for i in range(5)]
     for tx in txs:
         mp.add(tx)
 
     mp.remove([txs[0].txid, txs[2].txid])
-    remaining_ids = {tx.txid for tx in mp.peek()}
 
     check("R20a: pool size == 3 after removing 2", mp.size() == 3)
     check("R20b: removed txids no longer in pool",
-          txs[0].txid not in remaining_ids and
-          txs[2].txid not in remaining_ids)
+          not mp.contains(txs[0].txid) and not mp.contains(txs[2].txid))
+    check("R20c: other txids still in pool",
+          all(mp.contains(txs[i].txid) for i in (1, 3, 4)))
+
+    mp.remove(["not-hex", txs[1].txid[:-1]])
+    check("R20d: malformed txids are ignored by remove() and contains()",
+          mp.size() == 3 and not mp.contains("not-hex") and
+          not mp.contains(txs[1].txid[:-1]))
 
 
 # ============================================================================
@@ -568,17 +600,15 @@ def main():
     test_mempool_remove()
 
     print("\n" + "=" * 62)
-    passed = sum(1 for _, ok in _results if ok)
-    total  = len(_results)
-    colour = "\033[32m" if passed == total else "\033[31m"
-    print(f"  {colour}Results: {passed}/{total} passed\033[0m")
-    if passed < total:
+    total  = _passed + len(_failed)
+    colour = "\033[31m" if _failed else "\033[32m"
+    print(f"  {colour}Results: {_passed}/{total} passed\033[0m")
+    if _failed:
         print("  Failed:")
-        for name, ok in _results:
-            if not ok:
-                print(f"    ✗  {name}")
+        for name in _failed:
+            print(f"    ✗  {name}")
     print("=" * 62)
-    return passed == total
+    return not _failed
 
 
 if __name__ == "__main__":
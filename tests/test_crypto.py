@@ -0,0 +1,260 @@
+"""
+tests/test_crypto.py
+=====================
+Verifies the elliptic-curve and signature code in core/crypto_identity.py,
+the Merkle tree in core/merkle.py and batch verification in core/tx_batch.py.
+
+Run with:
+    python tests/test_crypto.py
+or (with pytest):
+    python -m pytest tests/test_crypto.py -v
+
+Requirements tested
+-------------------
+C1. The fixed-base table (scalar_mult_G) agrees with Double-and-Add k*G
+C2. The pure-Python fallback and libsecp256k1 accept each other's keys/signatures
+C3. verify_cached only serves the exact (msg, sig, pk) it saw and stays bounded
+C4. Every leaf's merkle_proof folds back to merkle_root, for 1-9 leaves
+C5. TxBatch.verify_all catches one bad signature mid-batch, serial and pooled
+"""
+
+import sys, os, secrets, hashlib
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import core.crypto_identity as ci
+from core.crypto_identity import G, INF, n, p, scalar_mult, scalar_mult_G
+from core.merkle import hash_pair, merkle_root, merkle_proof
+from core.transaction import Transaction
+from core.tx_batch import TxBatch, PARALLEL_MIN_ROWS
+
+# ────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+PASS = "\033[32mPASS\033[0m"
+FAIL = "\033[31mFAIL\033[0m"
+_passed = 0
+_failed = []            # names of failed checks; the total is _passed + len(_failed)
+
+def check(name, condition, detail=""):
+    global _passed
+    status = PASS if condition else FAIL
+    line = f"  [{status}] {name}"
+    if detail:
+        line += f"\n           {detail}"
+    print(line)
+    if condition:
+        _passed += 1
+    else:
+        _failed.append(name)
+    return bool(condition)
+
+class pure_python:
+    """Context manager forcing crypto_identity onto its pure-Python path."""
+
+    def __enter__(self):
+        self.saved, ci._backend = ci._backend, None
+
+    def __exit__(self, *exc):
+        ci._backend = self.saved
+
+def fold_proof(leaf, index, proof):
+    """Root reached by hashing leaf up through its proof's siblings."""
+    node = leaf
+    for sibling in proof:
+        node = hash_pair(sibling, node) if index & 1 else hash_pair(node, sibling)
+        index >>= 1
+    return node
+
+
+# ============================================================================
+# C1: Fixed-base scalar multiplication
+# ============================================================================
+
+def test_scalar_mult_G():
+    print("\n── C1: scalar_mult_G vs Double-and-Add ──")
+    scalars = [secrets.randbelow(n - 1) + 1 for _ in range(8)]
+    mismatched = [k for k in scalars if scalar_mult_G(k) != scalar_mult(k, G)]
+    check("C1a: random scalars give the same point",
+          not mismatched, f"mismatched k: {mismatched}" if mismatched else "")
+    check("C1b: k = 1 -> G", scalar_mult_G(1) == scalar_mult(1, G) == G)
+    check("C1c: k = n-1 -> -G",
+          scalar_mult_G(n - 1) == scalar_mult(n - 1, G) == (G[0], p - G[1]))
+    check("C1d: k = n and k = 0 -> point at infinity",
+          scalar_mult_G(n) == INF and scalar_mult_G(0) == INF)
+
+
+# ============================================================================
+# C2: Pure-Python fallback vs libsecp256k1
+# ============================================================================
+
+def test_fallback_matches_backend():
+    print("\n── C2: pure-Python fallback vs libsecp256k1 ──")
+    backend = ci._backend
+    if backend is None:
+        print("  (coincurve not installed – cross-check skipped)")
+        return
+
+    msg = b"0x1a2b:0x3c4d:100 barrels delivered"
+    with pure_python():
+        sk, pk = ci.generate_keypair()
+        py_sig = ci.sign(msg, sk)
+    check("C2a: same secret key -> same public key",
+          pk == backend.pubkey_from_secret(sk))
+    check("C2b: libsecp256k1 accepts a pure-Python signature",
+          backend.verify(msg, py_sig, pk))
+
+    lib_sig = backend.sign(msg, sk)
+    with pure_python():
+        ok = ci.verify(msg, lib_sig, pk)
+        bad = ci.verify(msg + b"!", lib_sig, pk)
+    check("C2c: pure-Python verify accepts a libsecp256k1 signature", ok)
+    check("C2d: pure-Python verify rejects it for another message", not bad)
+
+
+# ============================================================================
+# C3: Verify cache
+# ============================================================================
+
+def test_verify_cache():
+    print("\n── C3: verify_cached LRU ──")
+    sk, pk = ci.generate_keypair()
+    _, other_pk = ci.generate_keypair()
+    msg = b"0x1a2b:0x3c4d:crude shipped"
+    sig = ci.sign(msg, sk)
+    forged = sig[:32] + bytes(32)
+    ci._verify_cache.clear()
+
+    real_verify, calls = ci.verify, []
+    ci.verify = lambda *args: calls.append(args) or real_verify(*args)
+    try:
+        first = ci.verify_cached(msg, sig, pk)
+        again = ci.verify_cached(msg, sig, pk)
+        check("C3a: a valid triple is verified once, then served from the cache",
+              first and again and len(calls) == 1)
+        check("C3b: same msg with another signature is not served from the cache",
+              not ci.verify_cached(msg, forged, pk) and len(calls) == 2)
+        check("C3c: same msg and signature under another pk is not served either",
+              not ci.verify_cached(msg, sig, other_pk) and len(calls) == 3)
+    finally:
+        ci.verify = real_verify
+
+    # Fill past the bound with a stub verify: only cache bookkeeping is tested
+    ci._verify_cache.clear()
+    ci.verify = lambda *args: True
+    try:
+        limit = ci._VERIFY_CACHE_MAX
+        for i in range(limit + 10):
+            ci.verify_cached(b"msg %d" % i, sig, pk)
+        check("C3d: cache never grows past _VERIFY_CACHE_MAX",
+              len(ci._verify_cache) == limit, f"size={len(ci._verify_cache)}")
+        check("C3e: the oldest entries are the ones evicted",
+              (b"msg 9", sig, pk) not in ci._verify_cache and
+              (b"msg 10", sig, pk) in ci._verify_cache and
+              (b"msg %d" % (limit + 9), sig, pk) in ci._verify_cache)
+    finally:
+        ci.verify = real_verify
+        ci._verify_cache.clear()
+
+
+# ============================================================================
+# C4: Merkle proofs
+# ============================================================================
+
+def test_merkle_proofs():
+    print("\n── C4: Merkle proofs ──")
+    bad = []
+    for count in range(1, 10):
+        leaves = [hashlib.sha256(b"tx %d" % i).digest() for i in range(count)]
+        root = merkle_root(leaves)
+        bad += [(count, i) for i in range(count)
+                if fold_proof(leaves[i], i, merkle_proof(leaves, i)) != root]
+    check("C4a: every leaf's proof reproduces the root (1-9 leaves)",
+          not bad, f"failing (leaves, index): {bad}" if bad else "")
+
+    leaves = [hashlib.sha256(b"tx %d" % i).digest() for i in range(5)]
+    root = merkle_root(leaves)
+    proof = merkle_proof(leaves, 2)
+    check("C4b: a proof does not fit another leaf or position",
+          fold_proof(leaves[3], 2, proof) != root and
+          fold_proof(leaves[2], 3, proof) != root)
+
+
+# ============================================================================
+# C5: Batch verification
+# ============================================================================
+
+class CountingPool:
+    """ThreadPoolExecutor wrapper that counts submitted shards."""
+
+    def __init__(self, workers):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.submitted = 0
+
+    def submit(self, *args):
+        self.submitted += 1
+        return self.pool.submit(*args)
+
+
+def test_tx_batch_tampered_row():
+    print("\n── C5: TxBatch with one tampered signature ──")
+    sk, pk = ci.generate_keypair()
+    n_rows = PARALLEL_MIN_ROWS
+    txs = Transaction.build_many(sk, pk, ["0xBEEF"] * n_rows,
+                                 [f"barrel lot {i}" for i in range(n_rows)])
+    bad = n_rows // 2
+
+    def run(pool=None, shards=1):
+        ci._verify_cache.clear()    # every row is really checked each run
+        return TxBatch(txs).verify_all(pool, shards)
+
+    pool = CountingPool(4)
+    check("C5a: untampered batch passes, serial and pooled",
+          run() and run(pool, 4) and pool.submitted == 4)
+
+    sig = txs[bad].signature
+    txs[bad].signature = sig[:-1] + bytes([sig[-1] ^ 1])
+    try:
+        pool.submitted = 0
+        serial = run()
+        pooled = run(pool, 4)
+        check("C5b: serial verify_all rejects the tampered row", not serial)
+        check("C5c: pooled verify_all rejects it (rows split over the pool)",
+              not pooled and pool.submitted == 4)
+    finally:
+        txs[bad].signature = sig
+        pool.pool.shutdown()
+        ci._verify_cache.clear()
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def main():
+    print("=" * 62)
+    print("  Crypto – Test Suite")
+    print("=" * 62)
+
+    test_scalar_mult_G()
+    test_fallback_matches_backend()
+    test_verify_cache()
+    test_merkle_proofs()
+    test_tx_batch_tampered_row()
+
+    print("\n" + "=" * 62)
+    total  = _passed + len(_failed)
+    colour = "\033[31m" if _failed else "\033[32m"
+    print(f"  {colour}Results: {_passed}/{total} passed\033[0m")
+    if _failed:
+        print("  Failed:")
+        for name in _failed:
+            print(f"    ✗  {name}")
+    print("=" * 62)
+    return not _failed
+
+
+if __name__ == "__main__":
+    ok = main()
+    sys.exit(0 if ok else 1)
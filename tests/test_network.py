@@ -0,0 +1,292 @@
+"""
+tests/test_network.py
+======================
+Verifies the node-to-node wire layer in network/node.py.
+
+Run with:
+    python tests/test_network.py
+or (with pytest):
+    python -m pytest tests/test_network.py -v
+
+Requirements tested
+-------------------
+N1. A frame split across several reads is reassembled
+N2. Several frames arriving in one read are all returned, in order
+N3. A peer closing mid-header or mid-body yields None, not a bad frame
+N4. Peers get their send lock/socket slot when added to the peer set
+N5. A gossip socket the peer has closed is replaced; the frame still arrives
+N6. The block-verify thread pool is only started for blocks big enough to use it
+"""
+
+import sys, os, socket, threading, time, tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import network.node as node_mod
+from network.node import Node, _frame, _recv_framed, _FrameReader
+from core.tx_batch import PARALLEL_MIN_ROWS
+
+# ────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+PASS = "\033[32mPASS\033[0m"
+FAIL = "\033[31mFAIL\033[0m"
+_passed = 0
+_failed = []            # names of failed checks; the total is _passed + len(_failed)
+
+def check(name, condition, detail=""):
+    global _passed
+    status = PASS if condition else FAIL
+    line = f"  [{status}] {name}"
+    if detail:
+        line += f"\n           {detail}"
+    print(line)
+    if condition:
+        _passed += 1
+    else:
+        _failed.append(name)
+    return bool(condition)
+
+def send_in_pieces(sock, data, sizes, pause=0.02):
+    """Writes data as consecutive chunks of the given sizes, pausing between."""
+    def _run():
+        pos = 0
+        for n in sizes:
+            sock.sendall(data[pos:pos + n])
+            pos += n
+            time.sleep(pause)
+        sock.sendall(data[pos:])
+    t = threading.Thread(target=_run, daemon=True)
+    t.start()
+    return t
+
+class FramePeer:
+    """Listening socket standing in for a peer; records every frame received."""
+
+    def __init__(self):
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.addr     = self.listener.getsockname()
+        self.conns    = []
+        self.received = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.conns.append(conn)
+            threading.Thread(target=self._read, args=(conn,), daemon=True).start()
+
+    def _read(self, conn):
+        while True:
+            try:
+                msg = _recv_framed(conn)
+            except OSError:
+                return
+            if msg is None:
+                return
+            self.received.append(msg)
+
+    def close(self):
+        # shutdown() first: it wakes the threads blocked in accept()/recv();
+        # close() alone leaves those sockets open until the call returns
+        for sock in [self.listener] + self.conns:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+def make_node(port):
+    """A real Node whose chain log lives in a throw-away directory."""
+    fmt = node_mod.DB_PATH_FMT
+    node_mod.DB_PATH_FMT = os.path.join(tempfile.mkdtemp(), "db_{port}.jsonl")
+    try:
+        return Node("127.0.0.1", port, [])
+    finally:
+        node_mod.DB_PATH_FMT = fmt
+
+def wait_for(cond, timeout=2.0):
+    deadline = time.time() + timeout
+    while not cond() and time.time() < deadline:
+        time.sleep(0.01)
+    return cond()
+
+
+# ============================================================================
+# N1-N3: Length-prefixed framing
+# ============================================================================
+
+def test_frame_split_across_reads():
+    print("\n── N1: frame split across reads ──")
+    msg = {"type": "TX", "data": "x" * 5000}
+    frame = _frame(msg)
+
+    a, b = socket.socketpair()
+    with a, b:
+        # header itself split, then the body in uneven pieces
+        t = send_in_pieces(a, frame, [2, 3, 700, 1])
+        got = _recv_framed(b)
+        t.join()
+    check("N1a: _recv_framed reassembles a split frame", got == msg)
+
+    reader = _FrameReader()
+    early = [reader.feed(frame[i:i + 1]) for i in range(len(frame) - 1)]
+    last = reader.feed(frame[-1:])
+    check("N1b: _FrameReader returns nothing until the frame is whole",
+          not any(early) and last == [msg] and not reader.buf)
+
+
+def test_several_frames_in_one_read():
+    print("\n── N2: several frames in one read ──")
+    msgs = [{"type": "LIVENESS"}, {"type": "TX", "n": 1}, {"type": "TX", "n": 2}]
+    data = b"".join(_frame(m) for m in msgs)
+
+    a, b = socket.socketpair()
+    with a, b:
+        a.sendall(data)
+        got = [_recv_framed(b) for _ in msgs]
+    check("N2a: _recv_framed reads back-to-back frames in order", got == msgs)
+
+    reader = _FrameReader()
+    tail = _frame({"type": "BLOCK"})
+    first = reader.feed(data + tail[:3])
+    rest = reader.feed(tail[3:])
+    check("N2b: _FrameReader splits one chunk into every whole frame",
+          first == msgs and rest == [{"type": "BLOCK"}])
+
+
+def test_peer_closes_mid_frame():
+    print("\n── N3: peer closes mid-frame ──")
+    frame = _frame({"type": "TX", "data": "y" * 100})
+
+    a, b = socket.socketpair()
+    with b:
+        a.sendall(frame[:2])
+        a.close()
+        got_header = _recv_framed(b)
+    check("N3a: close mid-header -> None", got_header is None)
+
+    a, b = socket.socketpair()
+    with b:
+        a.sendall(frame[:len(frame) // 2])
+        a.close()
+        got_body = _recv_framed(b)
+    check("N3b: close mid-body -> None", got_body is None)
+
+    a, b = socket.socketpair()
+    with b:
+        a.close()
+        got_empty = _recv_framed(b)
+    check("N3c: close before any byte -> None", got_empty is None)
+
+
+# ============================================================================
+# N4-N5: Persistent per-peer gossip sockets
+# ============================================================================
+
+def test_peer_slots_created_with_peer_set():
+    print("\n── N4: per-peer send state created with the peer set ──")
+    node = make_node(9741)
+    peers = {("127.0.0.1", 9742), ("127.0.0.1", 9743)}
+    node.peers = peers
+    locks = dict(node._peer_locks)
+    node.peers = peers | {("127.0.0.1", 9744)}
+
+    check("N4a: every peer has a lock and an unconnected socket slot",
+          set(node._peer_locks) >= node.peers and
+          all(node._peer_conns[p] is None for p in node.peers))
+    check("N4b: re-assigning the peer set keeps existing locks",
+          all(node._peer_locks[p] is locks[p] for p in peers))
+    check("N4c: send to a peer outside the set is refused",
+          node._send_to_peer(("127.0.0.1", 9), _frame({})) is False)
+
+
+def test_reconnect_after_peer_closes():
+    print("\n── N5: reconnect after the peer drops the gossip socket ──")
+    peer = FramePeer()
+    node = make_node(9745)
+    node.peers = {peer.addr}
+
+    ok1 = node._send_to_peer(peer.addr, _frame({"n": 1}))
+    wait_for(lambda: len(peer.received) == 1)
+
+    # Kill the peer's end of the cached connection
+    peer.conns[0].shutdown(socket.SHUT_RDWR)
+    peer.conns[0].close()
+    time.sleep(0.05)
+
+    ok2 = node._send_to_peer(peer.addr, _frame({"n": 2}))
+    arrived = wait_for(lambda: len(peer.received) == 2)
+    check("N5a: send after the peer closed reconnects and delivers",
+          ok1 and ok2 and arrived and
+          peer.received == [{"n": 1}, {"n": 2}] and len(peer.conns) == 2,
+          f"received={peer.received} connections={len(peer.conns)}")
+
+    ok3 = node._send_to_peer(peer.addr, _frame({"n": 3}))
+    check("N5b: later sends reuse the new connection",
+          ok3 and wait_for(lambda: len(peer.received) == 3) and
+          len(peer.conns) == 2)
+
+    peer.close()
+    time.sleep(0.05)
+    ok4 = node._send_to_peer(peer.addr, _frame({"n": 4}))
+    check("N5c: peer gone entirely -> send reports False", ok4 is False)
+
+
+# ============================================================================
+# N6: Block-verify pool
+# ============================================================================
+
+def test_verify_pool_started_lazily():
+    print("\n── N6: block-verify pool started on demand ──")
+    node = make_node(9747)
+    small = node._block_verify_pool(node_mod.TX_PER_BLOCK)
+    check("N6a: no pool for a normal-sized block",
+          small is None and node._verify_pool is None)
+
+    if node_mod.VERIFY_WORKERS < 2:
+        check("N6b: single CPU -> large blocks stay serial too",
+              node._block_verify_pool(PARALLEL_MIN_ROWS) is None)
+        return
+    pool = node._block_verify_pool(PARALLEL_MIN_ROWS)
+    check("N6b: large block starts the pool once and reuses it",
+          pool is not None and node._verify_pool is pool and
+          node._block_verify_pool(PARALLEL_MIN_ROWS * 2) is pool)
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def main():
+    print("=" * 62)
+    print("  Node Networking – Test Suite")
+    print("=" * 62)
+
+    test_frame_split_across_reads()
+    test_several_frames_in_one_read()
+    test_peer_closes_mid_frame()
+    test_peer_slots_created_with_peer_set()
+    test_reconnect_after_peer_closes()
+    test_verify_pool_started_lazily()
+
+    print("\n" + "=" * 62)
+    total  = _passed + len(_failed)
+    colour = "\033[31m" if _failed else "\033[32m"
+    print(f"  {colour}Results: {_passed}/{total} passed\033[0m")
+    if _failed:
+        print("  Failed:")
+        for name in _failed:
+            print(f"    ✗  {name}")
+    print("=" * 62)
+    return not _failed
+
+
+if __name__ == "__main__":
+    ok = main()
+    sys.exit(0 if ok else 1)
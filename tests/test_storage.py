@@ -0,0 +1,183 @@
+"""
+tests/test_storage.py
+======================
+Verifies loading the on-disk chain log in core/blockchain.py.
+
+Run with:
+    python tests/test_storage.py
+or (with pytest):
+    python -m pytest tests/test_storage.py -v
+
+Requirements tested
+-------------------
+S1. The link scan reads block headers only and rejects partial records
+S2. An intact log loads every block and is left untouched
+S3. A torn last line is dropped and the log rewritten without it
+S4. A line that does not link to the one before cuts the chain there
+S5. replace_chain() closes the loaded log's mapping and rewrites the log
+"""
+
+import sys, os, tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.crypto_identity import generate_keypair, address_from_pk
+from core.transaction import Transaction
+from core.block import Block
+from core.blockchain import Blockchain, _LazyChain, _read_header, _dumps
+
+# ────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+PASS = "\033[32mPASS\033[0m"
+FAIL = "\033[31mFAIL\033[0m"
+_passed = 0
+_failed = []            # names of failed checks; the total is _passed + len(_failed)
+
+def check(name, condition, detail=""):
+    global _passed
+    status = PASS if condition else FAIL
+    line = f"  [{status}] {name}"
+    if detail:
+        line += f"\n           {detail}"
+    print(line)
+    if condition:
+        _passed += 1
+    else:
+        _failed.append(name)
+    return bool(condition)
+
+_SK, _PK = generate_keypair()
+_ADDR    = address_from_pk(_PK)
+
+def make_chain(n_blocks=3):
+    """A Blockchain in a throw-away directory with genesis + n_blocks blocks."""
+    path = os.path.join(tempfile.mkdtemp(), "db.jsonl")
+    bc = Blockchain(db_path=path)
+    for i in range(n_blocks):
+        bc.add_block([Transaction(_SK, _PK, _ADDR, f"block {i} tx {j}")
+                      for j in range(2)])
+    return bc
+
+def read_lines(path):
+    with open(path, "rb") as f:
+        return f.read().splitlines()
+
+
+# ============================================================================
+# S1: Header-only link scan
+# ============================================================================
+
+def test_header_scan():
+    print("\n── S1: header-only link scan ──")
+    bc = make_chain(1)
+    line = _dumps(bc.chain[-1].to_dict())
+    header = _read_header(line)
+    check("S1a: header fields parsed without transactions",
+          header is not None and header["hash"] == bc.chain[-1].hash and
+          header["prev_hash"] == bc.chain[0].hash and
+          "transactions" not in header)
+    check("S1b: record cut short inside its transactions -> None",
+          _read_header(line[:len(line) - 10]) is None)
+    check("S1c: record with no transactions key -> None",
+          _read_header(line[:line.find(b'"transactions"')]) is None)
+
+
+# ============================================================================
+# S2-S4: Loading intact and damaged logs
+# ============================================================================
+
+def test_intact_log():
+    print("\n── S2: intact log ──")
+    bc = make_chain(3)
+    before = read_lines(bc.db_path)
+    loaded = Blockchain(db_path=bc.db_path)
+    check("S2a: every block loaded in order",
+          [b.hash for b in loaded.chain] == [b.hash for b in bc.chain])
+    check("S2b: log file not rewritten", read_lines(bc.db_path) == before)
+
+
+def test_torn_last_line():
+    print("\n── S3: torn last line ──")
+    bc = make_chain(3)
+    lines = read_lines(bc.db_path)
+    with open(bc.db_path, "wb") as f:
+        f.write(b"\n".join(lines[:-1]) + b"\n" + lines[-1][:len(lines[-1]) // 2])
+
+    loaded = Blockchain(db_path=bc.db_path)
+    check("S3a: chain keeps the blocks before the torn line",
+          [b.hash for b in loaded.chain] == [b.hash for b in bc.chain[:-1]])
+    check("S3b: log rewritten without the torn line",
+          read_lines(bc.db_path) == lines[:-1])
+
+
+def test_unlinked_line():
+    print("\n── S4: unlinked line ──")
+    bc = make_chain(3)
+    lines = read_lines(bc.db_path)
+    foreign = Block("f" * 64, [Transaction(_SK, _PK, _ADDR, "foreign")])
+    lines.insert(2, _dumps(foreign.to_dict()))
+    with open(bc.db_path, "wb") as f:
+        f.write(b"\n".join(lines) + b"\n")
+
+    loaded = Blockchain(db_path=bc.db_path)
+    check("S4a: chain cut at the first unlinked line",
+          [b.hash for b in loaded.chain] == [b.hash for b in bc.chain[:2]])
+    check("S4b: log rewritten to the linked prefix",
+          read_lines(bc.db_path) == lines[:2])
+    check("S4c: reloading the rewritten log gives the same chain",
+          [b.hash for b in Blockchain(db_path=bc.db_path).chain] ==
+          [b.hash for b in bc.chain[:2]])
+
+
+# ============================================================================
+# S5: Replacing the chain
+# ============================================================================
+
+def test_replace_chain():
+    print("\n── S5: replace_chain ──")
+    bc = make_chain(2)
+    loaded = Blockchain(db_path=bc.db_path)
+    lazy = loaded.chain
+    longer = make_chain(4)
+
+    loaded.replace_chain(longer.chain)
+    check("S5a: chain loaded from disk is a lazy view",
+          isinstance(lazy, _LazyChain))
+    check("S5b: replace_chain closes the old view's mapping", lazy._mm.closed)
+    check("S5c: log rewritten with the new chain",
+          read_lines(bc.db_path) == read_lines(longer.db_path) and
+          [b.hash for b in Blockchain(db_path=bc.db_path).chain] ==
+          [b.hash for b in longer.chain])
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def main():
+    print("=" * 62)
+    print("  Chain Storage – Test Suite")
+    print("=" * 62)
+
+    test_header_scan()
+    test_intact_log()
+    test_torn_last_line()
+    test_unlinked_line()
+    test_replace_chain()
+
+    print("\n" + "=" * 62)
+    total  = _passed + len(_failed)
+    colour = "\033[31m" if _failed else "\033[32m"
+    print(f"  {colour}Results: {_passed}/{total} passed\033[0m")
+    if _failed:
+        print("  Failed:")
+        for name in _failed:
+            print(f"    ✗  {name}")
+    print("=" * 62)
+    return not _failed
+
+
+if __name__ == "__main__":
+    ok = main()
+    sys.exit(0 if ok else 1)